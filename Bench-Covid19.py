@@ -0,0 +1,497 @@
+# -------------------------------------------------------------------------------------------------#
+# Bench-Covid19.py: Offline benchmark for SlackPost-Covid19.py                                     #
+# -------------------------------------------------------------------------------------------------#
+#  AUTHOR: Yuhui.Seo        2026/10/18                                                             #
+# --< CHANGE HISTORY >-----------------------------------------------------------------------------#
+#          Yuhui.Seo        2026/10/18 #001(Local API/Slack stand-ins, pipeline benchmarks)        #
+#          Yuhui.Seo        2026/10/18 #002(QuickChart stand-in, long-series chart URL benchmark)  #
+#          Yuhui.Seo        2026/10/18 #003(Message rendering benchmark for N variants)            #
+#          Yuhui.Seo        2026/10/18 #004(Chart render pool throughput benchmark)                #
+#          Yuhui.Seo        2026/10/18 #005(Slack file upload stand-in, chart upload benchmark)    #
+# --< Version >------------------------------------------------------------------------------------#
+#          Python version 3.11.0 (Requires python version 3.10 or higher.)                         #
+# -------------------------------------------------------------------------------------------------#
+# 공공데이터 API(callCovid04Api)와 Slack Web API를 로컬 서버로 대체하여 파이프라인 단계별 시간 측정     #
+# 결과는 Bench-Result/bench_YYYYMMDDHHMMSS.json에 저장하고 직전 결과와 비교하여 성능 저하를 표시      #
+# -------------------------------------------------------------------------------------------------#
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+from datetime import date, datetime, timedelta
+import os
+import sys
+import json
+import glob
+import time
+import shutil
+import socket
+import hashlib
+import argparse
+import tempfile
+import contextlib
+import threading
+import statistics
+import configparser
+import importlib.util
+
+PROGRAM_DIR = os.path.dirname(os.path.abspath(__file__))
+REGIONS = [
+    ('합계', 'Total'), ('서울', 'Seoul'), ('부산', 'Busan'), ('대구', 'Daegu'),
+    ('인천', 'Incheon'), ('광주', 'Gwangju'), ('대전', 'Daejeon'), ('울산', 'Ulsan'),
+    ('세종', 'Sejong'), ('경기', 'Gyeonggi-do'), ('강원', 'Gangwon-do'),
+    ('충북', 'Chungcheongbuk-do'), ('충남', 'Chungcheongnam-do'), ('전북', 'Jeollabuk-do'),
+    ('전남', 'Jeollanam-do'), ('경북', 'Gyeongsangbuk-do'), ('경남', 'Gyeongsangnam-do'),
+    ('제주', 'Jeju'), ('검역', 'Lazaretto'),
+]
+# QuickChart 대체 응답 이미지 (1x1 PNG)
+PNG = bytes.fromhex(
+    '89504e470d0a1a0a0000000d4948445200000001000000010806000000'
+    '1f15c4890000000b49444154789c63f80f040009fb03fdfb5e6b2b0000000049454e44ae426082')
+
+
+def load_program():
+    # 파일명에 '-'가 있어 import 문 대신 경로로 로드
+    spec = importlib.util.spec_from_file_location(
+        'slackpost_covid19', os.path.join(PROGRAM_DIR, 'SlackPost-Covid19.py'))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # 차트 렌더링 프로세스에 함수를 이름으로 전달하기 위해 등록
+    spec.loader.exec_module(module)
+    return module
+
+
+class Covid19Data:
+    # callCovid04Api 형식의 XML 생성 (recorded 지정 시 저장된 응답 파일 사용)
+    def __init__(self, regions, recorded=None, empty_weekdays=()):
+        self.regions = self.set_regions(regions)
+        self.recorded = recorded
+        self.empty_weekdays = set(empty_weekdays)
+
+    def set_regions(self, count):
+        regions = list(REGIONS[:count])
+        for i in range(len(regions), count):
+            regions.append((f"지역{i}", f"Region{i}"))
+        return regions
+
+    def get_items(self, std_day):
+        if std_day.weekday() in self.empty_weekdays:
+            return []
+        items = []
+        base = std_day.toordinal() % 997
+        for i, (gubun, gubun_en) in enumerate(self.regions):
+            inc_dec = base + i * 7
+            items.append(
+                '<item>\n'
+                f'<createDt>{std_day.isoformat()} 09:00:00.000</createDt>\n'
+                f'<deathCnt>{i * 3}</deathCnt>\n'
+                f'<defCnt>{inc_dec * 1000}</defCnt>\n'
+                f'<gubun>{gubun}</gubun>\n'
+                f'<gubunCn>{gubun}</gubunCn>\n'
+                f'<gubunEn>{gubun_en}</gubunEn>\n'
+                f'<incDec>{inc_dec}</incDec>\n'
+                '<isolClearCnt>0</isolClearCnt>\n'
+                '<isolIngCnt>0</isolIngCnt>\n'
+                f'<localOccCnt>{inc_dec - 2}</localOccCnt>\n'
+                '<overFlowCnt>2</overFlowCnt>\n'
+                f'<qurRate>{inc_dec / 10:.1f}</qurRate>\n'
+                f'<stdDay>{std_day.isoformat()}</stdDay>\n'
+                '</item>\n')
+        return items
+
+    def get_body(self, std_day, page_no=1, num_of_rows=500):
+        if self.recorded:
+            file_path = os.path.join(self.recorded, std_day.strftime('%Y%m%d') + '_InfRegion.xml')
+            if os.path.isfile(file_path):
+                with open(file_path, 'rb') as file:
+                    return file.read()
+        items = self.get_items(std_day)
+        page = items[(page_no - 1) * num_of_rows:page_no * num_of_rows]
+        return (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<response>\n<header>\n<resultCode>00</resultCode>\n'
+            '<resultMsg>NORMAL SERVICE.</resultMsg>\n</header>\n'
+            f'<body>\n<items>\n{"".join(page)}</items>\n<numOfRows>{num_of_rows}</numOfRows>\n'
+            f'<pageNo>{page_no}</pageNo>\n<totalCount>{len(items)}</totalCount>\n</body>\n'
+            '</response>\n').encode('utf-8')
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+
+    def send_body(self, body, content_type):
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if urlsplit(self.path).path.startswith('/chart'):
+            # QuickChart 대체 (/chart?c=..., /chart/render/<id>)
+            self.server.count('chart.render')
+            self.send_body(PNG, 'image/png')
+            return
+        # 공공데이터 API 대체
+        query = parse_qs(urlsplit(self.path).query)
+        std_day = datetime.strptime(query.get('std_day', [''])[0], '%Y-%m-%d').date()
+        page_no = int(query.get('pageNo', ['1'])[0])
+        num_of_rows = int(query.get('numOfRows', ['500'])[0])
+        self.server.count('api')
+        time.sleep(self.server.api_latency)
+        self.send_body(self.server.data.get_body(std_day, page_no, num_of_rows), 'application/xml')
+
+    def do_POST(self):
+        # Slack Web API 대체 (/api/<method>)
+        length = int(self.headers.get('Content-Length', 0))
+        request_body = self.rfile.read(length)
+        if urlsplit(self.path).path == '/chart/create':
+            # QuickChart 짧은 URL 발급 대체
+            self.server.count('chart.create')
+            chart_id = hashlib.sha256(request_body).hexdigest()[:16]
+            url = f"http://{self.headers.get('Host')}/chart/render/sf-{chart_id}"
+            self.send_body(json.dumps({'success': True, 'url': url}).encode('utf-8'),
+                           'application/json')
+            return
+        if urlsplit(self.path).path.startswith('/upload/'):
+            # Slack 파일 업로드 URL 대체 (files_upload_v2의 파일 전송 단계)
+            self.server.count('file.upload')
+            self.send_body(b'OK - ' + str(len(request_body)).encode('utf-8'), 'text/plain')
+            return
+        method = urlsplit(self.path).path.rsplit('/', 1)[-1]
+        self.server.count(method)
+        time.sleep(self.server.slack_latency)
+        if method == 'files.getUploadURLExternal':
+            file_id = 'F' + hashlib.sha256(request_body).hexdigest()[:10].upper()
+            body = json.dumps({'ok': True, 'file_id': file_id,
+                               'upload_url': f"http://{self.headers.get('Host')}/upload/{file_id}"})
+        elif method == 'files.completeUploadExternal':
+            files = json.loads(parse_qs(request_body.decode('utf-8')).get('files', ['[]'])[0])
+            body = json.dumps({'ok': True, 'files': [{'id': file['id'], 'title': file.get('title')}
+                                                     for file in files]})
+        else:
+            body = json.dumps({'ok': True, 'channel': 'CBENCH', 'ts': f"{time.time():.6f}"})
+        self.send_body(body.encode('utf-8'), 'application/json; charset=utf-8')
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, data, api_latency, slack_latency):
+        super().__init__(('127.0.0.1', 0), StandInHandler)
+        self.data = data
+        self.api_latency = api_latency
+        self.slack_latency = slack_latency
+        self.counts = {}
+        self.lock = threading.Lock()
+
+    def count(self, name):
+        with self.lock:
+            self.counts[name] = self.counts.get(name, 0) + 1
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+class Benchmark:
+    def __init__(self, program, args, base_url):
+        self.program = program
+        self.args = args
+        self.base_url = base_url
+        self.work_dir = tempfile.mkdtemp(prefix='bench-covid19-')
+        self.results = {}
+
+    def set_config(self):
+        config = configparser.ConfigParser()
+        config.read(os.path.join(PROGRAM_DIR, 'config.ini'), encoding='utf-8')
+        config['COVID19']['url'] = self.base_url + '/1352000/ODMS_COVID_04/callCovid04Api'
+        config['SLACK']['api_url'] = self.base_url + '/api/'
+        config['CHART']['renderer'] = 'quickchart'
+        config['CHART']['quickchart_url'] = self.base_url
+        for key in ('dir_download', 'dir_result', 'dir_chart'):
+            config['FILES'][key] = os.path.join(self.work_dir, config['FILES'][key])
+        config['FILES']['store_file'] = os.path.join(self.work_dir, 'Covid19.db')
+        return config
+
+    def reset_dir(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+        os.makedirs(self.work_dir)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def quiet():
+        # 측정 대상, 준비 단계의 진행 로그(print)는 출력하지 않음
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            yield
+
+    def measure(self, name, func, setup=None, repeat=None):
+        times = []
+        for _ in range(repeat or self.args.repeat):
+            with self.quiet():
+                if setup:
+                    setup()
+                start_time = time.perf_counter()
+                func()
+                times.append((time.perf_counter() - start_time) * 1000)
+        self.results[name] = {
+            'median_ms': round(statistics.median(times), 3),
+            'min_ms': round(min(times), 3),
+            'runs': len(times),
+        }
+        print(f"  {name:<24}: {statistics.median(times):10.2f} ms (min {min(times):.2f}, n={len(times)})")
+
+    def new_file_api(self, config):
+        program = self.program
+        sys_info = program.SystemInfo()
+        covid19 = program.Covid19API(sys_info, config)
+        return program.FileAPI(sys_info, config, covid19)
+
+    def bench_backfill(self):
+        # 캐시 없는 상태의 13일치 다운로드, 파일이 모두 있는 상태의 재실행
+        config = self.set_config()
+        self.measure('backfill_cold', lambda: self.new_file_api(config).set_date(),
+                     setup=self.reset_dir)
+        self.measure('backfill_warm', lambda: self.new_file_api(config).set_date())
+
+    def write_window(self, config, days, regions):
+        data = Covid19Data(regions)
+        file_api = self.new_file_api(config)
+        file_list = []
+        for i in range(days):
+            std_day = date.today() - timedelta(days=days - 1 - i)
+            file_path = file_api.set_filepath(std_day)
+            file_api.archive.write(file_path, data.get_body(std_day, num_of_rows=regions))
+            file_list.append(file_path)
+        return file_list
+
+    def bench_parse(self):
+        # 긴 기간, 많은 지역의 XML 추출 (파일 스트리밍 / 저장소 최초 반영 / 저장소 조회)
+        program = self.program
+        config = self.set_config()
+        self.reset_dir()
+        with self.quiet():
+            file_list = self.write_window(config, self.args.days, self.args.regions)
+        self.measure('parse_stream', lambda: program.ReadXmlData(file_list).get_data())
+
+        def reset_store():
+            if os.path.exists(config['FILES']['store_file']):
+                os.remove(config['FILES']['store_file'])
+
+        self.measure('parse_store_ingest',
+                     lambda: program.ReadXmlData(file_list, None, program.CovidStore(config)).get_data(),
+                     setup=reset_store)
+        store = program.CovidStore(config)
+        self.measure('parse_store_query',
+                     lambda: program.ReadXmlData(file_list, None, store).get_data())
+
+    def new_slack(self, config, days):
+        program = self.program
+        slack = program.SlackAPI(program.SystemInfo(), config)
+        labels = [(date.today() - timedelta(days=days - 1 - i)).isoformat() for i in range(days)]
+        values = [str(100 + i) for i in range(days)]
+        counts = {'전일대비확진자증감수': '1,000', '지역발생수': '990', '해외유입수': '10',
+                  'Incheon': '50', '누적확진자수': '1,000,000', '사망자수': '10'}
+        slack.set_payload(labels, values, counts)
+        return slack
+
+    def bench_post(self):
+        # QuickChart URL 생성, 메시지 생성, 로컬 Slack 대체 서버로 전송
+        program = self.program
+        try:
+            import slack_sdk  # noqa: F401
+        except ImportError:
+            print('  post                    : skipped (slack_sdk is not installed)')
+            return
+        config = self.set_config()
+        self.reset_dir()
+        os.makedirs(config['FILES']['dir_result'])
+        slack = self.new_slack(config, self.args.days)
+        i18n = program.I18nAPI()
+        texts = {lang: i18n.set_i18n(lang) for lang in i18n.i18n}
+        self.measure('quickchart_url', lambda: slack.set_chart_url(texts['ko']))
+        # 1년치 계열: LTTB로 줄인 뒤에도 URL이 길면 짧은 URL 발급 (같은 차트는 재사용)
+        long_slack = self.new_slack(config, 365)
+        self.measure('quickchart_url_365d', lambda: long_slack.set_chart_url(texts['ko']))
+        print(f"  quickchart url length   : {len(slack.set_chart_url(texts['ko']))} "
+              f"({self.args.days}d), {len(long_slack.set_chart_url(texts['ko']))} (365d)")
+        self.measure('build_messages', lambda: [slack.build_message(text, lang)
+                                                for lang, text in texts.items()])
+        self.bench_render(slack, texts)
+
+        def reset_result():
+            shutil.rmtree(config['FILES']['dir_result'], ignore_errors=True)
+            os.makedirs(config['FILES']['dir_result'])
+
+        self.measure('post_broadcast',
+                     lambda: program.Broadcast(config, slack, program.RunLedger(config)).send(
+                         program.SlackScheduler(config), texts),
+                     setup=reset_result)
+
+        # renderer = local: 언어별 차트 파일을 워크스페이스별 1회 업로드한 뒤 전송
+        os.makedirs(config['FILES']['dir_chart'], exist_ok=True)
+        chart_files = {}
+        for lang in texts:
+            chart_files[lang] = os.path.join(config['FILES']['dir_chart'], f"bench-chart_{lang}.png")
+            with open(chart_files[lang], 'wb') as file:
+                file.write(PNG)
+
+        def reset_upload():
+            reset_result()
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(slack.upload_file)
+
+        self.measure('post_broadcast_upload',
+                     lambda: program.Broadcast(config, slack, program.RunLedger(config)).send(
+                         program.SlackScheduler(config), texts, chart_files),
+                     setup=reset_upload)
+
+    def bench_render(self, slack, texts):
+        # 언어를 돌아가며 메시지 N개 생성: 메시지마다 구조부터 생성 / 언어별 구조를 재사용하여 값만 채움
+        variants = [(texts[lang], lang) for lang in list(texts) * (self.args.variants // len(texts) + 1)]
+        variants = variants[:self.args.variants]
+
+        def reset_templates():
+            slack.templates.clear()
+            slack.attachments.clear()
+
+        def build_uncached():
+            for text, lang in variants:
+                reset_templates()
+                slack.build_message(text, lang)
+
+        self.measure('render_uncached', build_uncached)
+        self.measure('render_template_cold', lambda: [slack.build_message(text, lang) for text, lang in variants],
+                     setup=reset_templates)
+        self.measure('render_template', lambda: [slack.build_message(text, lang) for text, lang in variants])
+
+    def bench_chart(self):
+        # 기간이 다른 차트 N개를 언어별 문구로 렌더링 (현재 프로세스 / 렌더링 풀), 같은 내용 재요청은 해시로 건너뜀
+        program = self.program
+        try:
+            import matplotlib  # noqa: F401
+        except ImportError:
+            print('  chart                   : skipped (matplotlib is not installed)')
+            return
+        config = self.set_config()
+        config['CHART']['font_cache_file'] = os.path.join(self.work_dir, 'font_cache.json')
+        i18n = program.I18nAPI()
+        langs = list(i18n.i18n)
+        jobs = []
+        for i in range(self.args.charts):
+            days = self.args.days + i
+            labels = [(date.today() - timedelta(days=days - 1 - day)).isoformat() for day in range(days)]
+            captions = {}
+            for lang in langs:
+                text = i18n.set_i18n(lang)
+                captions[lang + '_' + str(i)] = program.ChartCaption(
+                    text.get('plot_title'), text.get('plot_xlabel') + ' : ' + labels[-1], text.get('plot_xlabel'),
+                    text.get('plot_ylabel'), text.get('plot_data_one'))
+            jobs.append(program.ChartJob(labels, [100 + day * 7 + i for day in range(days)], captions))
+        files = self.args.charts * len(langs)
+
+        def reset_chart():
+            shutil.rmtree(config['FILES']['dir_chart'], ignore_errors=True)
+
+        repeat = min(self.args.repeat, 3)
+        for name, workers in (('chart_render_local', 1), ('chart_render_pool', self.args.chart_workers)):
+            config['CHART']['render_workers'] = str(workers)
+            with self.quiet():
+                chart = program.ChartAPI(config)
+                chart.pool.warm()  # 워커 시작, 폰트 로드는 측정에서 제외
+            self.measure(name, lambda: chart.render_charts(jobs), setup=reset_chart, repeat=repeat)
+            print(f"  {name + ' rate':<24}: {files / self.results[name]['median_ms'] * 1000:10.2f} "
+                  f"files/s (charts={len(jobs)}, languages={len(langs)}, workers={chart.pool.workers})")
+        self.measure('chart_render_cached', lambda: chart.render_charts(jobs))
+
+    def run(self):
+        print(f"Benchmark (days={self.args.days}, regions={self.args.regions}, "
+              f"api_latency={self.args.api_latency}s, slack_latency={self.args.slack_latency}s)")
+        try:
+            self.bench_backfill()
+            self.bench_parse()
+            self.bench_post()
+            self.bench_chart()
+        finally:
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+        return self.results
+
+
+def compare_results(results, previous, threshold):
+    regressions = []
+    for name, result in results.items():
+        before = previous.get('results', {}).get(name)
+        if not before:
+            continue
+        ratio = result['median_ms'] / before['median_ms'] if before['median_ms'] else 1
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            print(f"Regression : {name} {before['median_ms']:.2f} ms -> "
+                  f"{result['median_ms']:.2f} ms (x{ratio:.2f})")
+    return regressions
+
+
+def save_results(args, results, counts):
+    os.makedirs(args.output, exist_ok=True)
+    previous_files = sorted(glob.glob(os.path.join(args.output, 'bench_*.json')))
+    report = {
+        'created': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'hostname': socket.gethostname(),
+        'python': sys.version.split()[0],
+        'params': {key: value for key, value in vars(args).items() if key != 'output'},
+        'requests': counts,
+        'results': results,
+    }
+    file_path = os.path.join(args.output, 'bench_' + datetime.now().strftime('%Y%m%d%H%M%S') + '.json')
+    with open(file_path, 'w', encoding='utf-8') as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    print(f"Benchmark result saved successfully. : {file_path}")
+
+    if previous_files:
+        with open(previous_files[-1], encoding='utf-8') as file:
+            previous = json.load(file)
+        if previous.get('params') == report['params']:
+            return compare_results(results, previous, args.threshold)
+        print(f"Parameters differ from {previous_files[-1]}, comparison skipped.")
+    return []
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Offline benchmark for SlackPost-Covid19.py')
+    parser.add_argument('--days', type=int, default=13, help='days in the parse/chart window')
+    parser.add_argument('--regions', type=int, default=len(REGIONS), help='regions per response')
+    parser.add_argument('--api-latency', type=float, default=0.05, help='API stand-in latency (s)')
+    parser.add_argument('--slack-latency', type=float, default=0.05, help='Slack stand-in latency (s)')
+    parser.add_argument('--empty-weekdays', default='6',
+                        help='weekdays without data (0=Mon ... 6=Sun, comma separated)')
+    parser.add_argument('--recorded', default=None, metavar='DIR',
+                        help='serve recorded YYYYMMDD_InfRegion.xml files from DIR')
+    parser.add_argument('--variants', type=int, default=300, help='messages per rendering benchmark')
+    parser.add_argument('--charts', type=int, default=4, help='charts per rendering benchmark (one file per language each)')
+    parser.add_argument('--chart-workers', type=int, default=0,
+                        help='render pool processes (0: CPU count)')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per benchmark')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='report a regression when the median grows more than this ratio')
+    parser.add_argument('--output', default=os.path.join(PROGRAM_DIR, 'Bench-Result'),
+                        help='directory for result files')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    program = load_program()
+    empty_weekdays = [int(day) for day in args.empty_weekdays.split(',') if day.strip()]
+    server = StandInServer(Covid19Data(args.regions, args.recorded, empty_weekdays),
+                           args.api_latency, args.slack_latency)
+    base_url = server.start()
+    try:
+        results = Benchmark(program, args, base_url).run()
+    finally:
+        server.shutdown()
+    regressions = save_results(args, results, server.counts)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,23 +8,62 @@
 #          Yuhui.Seo        2023/02/27 #003(Add date flag and remove_duplicates fuction)           #
 #          Yuhui.Seo        2023/03/03 #004(Change common function and Apply Pyrint)               #
 #          Yuhui.Seo        2023/03/10 #005(Change class inheritance)                              #
+#          Yuhui.Seo        2026/10/18 #006(Concurrent backfill download, keep-alive connections)  #
+#          Yuhui.Seo        2026/10/18 #007(Add in-run response cache)                             #
+#          Yuhui.Seo        2026/10/18 #008(Streaming XML extractor with typed records)            #
+#          Yuhui.Seo        2026/10/18 #009(Add SQLite time-series store)                          #
+#          Yuhui.Seo        2026/10/18 #010(Add no-data cache and carry-forward of missing days)   #
+#          Yuhui.Seo        2026/10/18 #011(Lazy import matplotlib/slack_sdk, startup benchmark)   #
+#          Yuhui.Seo        2026/10/18 #012(Cache Korean font resolution for ChartAPI)             #
+#          Yuhui.Seo        2026/10/18 #013(Render chart once per run, upload once to Slack)       #
+#          Yuhui.Seo        2026/10/18 #014(Concurrent rate-limit aware Slack posting)             #
+#          Yuhui.Seo        2026/10/18 #015(Multi-channel / multi-workspace broadcast)             #
+#          Yuhui.Seo        2026/10/18 #016(Add daemon mode with adaptive polling)                 #
+#          Yuhui.Seo        2026/10/18 #017(Add offline benchmark suite, Slack api_url option)     #
+#          Yuhui.Seo        2026/10/18 #018(Per-stage timing, counters and metrics export)         #
+#          Yuhui.Seo        2026/10/18 #019(All-regions report with NumPy aggregates)              #
+#          Yuhui.Seo        2026/10/18 #020(Resumable bulk historical backfill)                    #
+#          Yuhui.Seo        2026/10/18 #021(Page through totalCount, num_of_rows option)           #
+#          Yuhui.Seo        2026/10/18 #022(Shared HttpClient with retries and circuit breaker)    #
+#          Yuhui.Seo        2026/10/18 #023(gzip xml files, monthly zip archive, retention)        #
+#          Yuhui.Seo        2026/10/18 #024(Run ledger with file locking replaces SlackPost.txt)   #
+#          Yuhui.Seo        2026/10/18 #025(Socket Mode /covid slash command with LRU cache)       #
+#          Yuhui.Seo        2026/10/18 #026(Incremental per-region threshold alerts)               #
+#          Yuhui.Seo        2026/10/18 #027(LTTB chart series, compact QuickChart URL/short URL)   #
+#          Yuhui.Seo        2026/10/18 #028(Locale catalog files, compiled message templates)      #
+#          Yuhui.Seo        2026/10/18 #029(Figure API chart render pool, content-hash skip)       #
 # --< Version >------------------------------------------------------------------------------------#
 #          Python version 3.11.0 (Requires python version 3.10 or higher.)                         #
 # -------------------------------------------------------------------------------------------------#
 # Main process                                                                                     #
 # -------------------------------------------------------------------------------------------------#
-from urllib import request as r, parse
-from urllib.error import URLError
+import time
+START_TIME = time.perf_counter()  # 프로세스 기동 시간 측정용 (--bench-startup)
+
+from urllib import parse
 from datetime import date, datetime, timedelta
 import os
+import sys
 import json
+import random
+import hashlib
+import argparse
+import contextlib
 import socket
+import sqlite3
+import threading
 import configparser
+import io
+import gzip
+import zipfile
 import xml.etree.ElementTree as ET
-import matplotlib.pyplot as plt      # requires: pip install matplotlib
-import matplotlib.font_manager as fm
-from slack_sdk import WebClient      # requires: pip install slack_sdk
-from slack_sdk.errors import SlackApiError
+from collections import OrderedDict, namedtuple
+# http.client, concurrent.futures, matplotlib, slack_sdk, numpy는 실제로 사용하는 시점에 import
+# (게시 대상이 없는 실행의 기동 시간 단축)
+# requires: pip install matplotlib slack_sdk numpy
+
+IMPORT_TIME = time.perf_counter()
+HEAVY_MODULES = ('matplotlib', 'slack_sdk', 'numpy')
 
 
 class SystemInfo:
@@ -81,17 +120,151 @@ class ReadConfig:
             return config
 
 
+class Metrics:
+    # 단계/외부 호출별 소요 시간(span)과 카운터를 기록하여 실행 종료 시 파일로 출력
+    # - 구조화 로그: dir_metrics/covid19_YYYYMMDD.jsonl (span 종료 시마다 1줄)
+    # - node exporter textfile collector: dir_metrics/covid19_slackbot.prom
+    # - JSON: dir_metrics/covid19_slackbot.json
+    PREFIX = 'covid19_slackbot'
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.dir_metrics = None
+        self.structured_log = False
+        self.reset()
+
+    def configure(self, config):
+        self.dir_metrics = config.get('METRICS', 'dir_metrics', fallback='') or None
+        self.structured_log = config.getboolean('METRICS', 'structured_log', fallback=True)
+
+    def reset(self):
+        with self.lock:
+            self.run_start = time.time()
+            self.spans = {}     # (이름, 라벨) -> [건수, 합계(초), 최대(초), 오류 건수]
+            self.counters = {}  # (이름, 라벨) -> 값
+
+    def get_key(self, name, labels):
+        return name, tuple(sorted(labels.items()))
+
+    def inc(self, name, value=1, **labels):
+        key = self.get_key(name, labels)
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    @contextlib.contextmanager
+    def span(self, name, **labels):
+        start_time = time.perf_counter()
+        error = None
+        try:
+            yield
+        except BaseException as exc:
+            error = type(exc).__name__
+            raise
+        finally:
+            self.record(name, time.perf_counter() - start_time, error, labels)
+
+    def record(self, name, duration, error=None, labels=None):
+        labels = labels or {}
+        key = self.get_key(name, labels)
+        with self.lock:
+            span = self.spans.setdefault(key, [0, 0.0, 0.0, 0])
+            span[0] += 1
+            span[1] += duration
+            span[2] = max(span[2], duration)
+            span[3] += 1 if error else 0
+        if self.structured_log and self.dir_metrics:
+            self.write_log({'time': datetime.now().isoformat(timespec='milliseconds'),
+                            'span': name, 'labels': labels,
+                            'duration_ms': round(duration * 1000, 3), 'error': error})
+
+    def write_log(self, entry):
+        file_name = 'covid19_' + date.today().strftime('%Y%m%d') + '.jsonl'
+        line = json.dumps(entry, ensure_ascii=False) + '\n'
+        with self.lock:
+            os.makedirs(self.dir_metrics, exist_ok=True)
+            with open(os.path.join(self.dir_metrics, file_name), 'a', encoding='utf-8') as file:
+                file.write(line)
+
+    def format_labels(self, labels, **extra):
+        items = list(labels) + sorted(extra.items())
+        if not items:
+            return ''
+        return '{' + ','.join(f'{key}="{value}"' for key, value in items) + '}'
+
+    def to_prometheus(self, success):
+        lines = []
+        prefix = self.PREFIX
+        with self.lock:
+            spans = dict(self.spans)
+            counters = dict(self.counters)
+        lines.append(f"# HELP {prefix}_span_duration_seconds Duration of stages and outbound calls in the last run.")
+        lines.append(f"# TYPE {prefix}_span_duration_seconds summary")
+        for (name, labels), (count, total, _, _) in sorted(spans.items()):
+            label_text = self.format_labels(labels, span=name)
+            lines.append(f"{prefix}_span_duration_seconds_sum{label_text} {total:.6f}")
+            lines.append(f"{prefix}_span_duration_seconds_count{label_text} {count}")
+        lines.append(f"# TYPE {prefix}_span_errors gauge")
+        for (name, labels), (_, _, _, errors) in sorted(spans.items()):
+            lines.append(f"{prefix}_span_errors{self.format_labels(labels, span=name)} {errors}")
+        for name in sorted({name for name, _ in counters}):
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            for (counter_name, labels), value in sorted(counters.items()):
+                if counter_name == name:
+                    lines.append(f"{prefix}_{name}_total{self.format_labels(labels)} {value}")
+        lines.append(f"# TYPE {prefix}_last_run_timestamp_seconds gauge")
+        lines.append(f"{prefix}_last_run_timestamp_seconds {self.run_start:.0f}")
+        lines.append(f"# TYPE {prefix}_last_run_success gauge")
+        lines.append(f"{prefix}_last_run_success {1 if success else 0}")
+        return '\n'.join(lines) + '\n'
+
+    def to_json(self, success):
+        with self.lock:
+            return {
+                'run_start': datetime.fromtimestamp(self.run_start).isoformat(timespec='seconds'),
+                'success': bool(success),
+                'spans': [{'span': name, 'labels': dict(labels), 'count': count,
+                           'total_ms': round(total * 1000, 3), 'max_ms': round(peak * 1000, 3),
+                           'errors': errors}
+                          for (name, labels), (count, total, peak, errors) in sorted(self.spans.items())],
+                'counters': [{'name': name, 'labels': dict(labels), 'value': value}
+                             for (name, labels), value in sorted(self.counters.items())],
+            }
+
+    def write(self, success):
+        # 실행 종료 시 호출 (textfile collector가 쓰기 중인 파일을 읽지 않도록 임시 파일 후 교체)
+        if not self.dir_metrics:
+            return
+        os.makedirs(self.dir_metrics, exist_ok=True)
+        outputs = {
+            self.PREFIX + '.prom': self.to_prometheus(success),
+            self.PREFIX + '.json': json.dumps(self.to_json(success), ensure_ascii=False, indent=2),
+        }
+        for file_name, content in outputs.items():
+            file_path = os.path.join(self.dir_metrics, file_name)
+            with open(file_path + '.tmp', 'w', encoding='utf-8') as file:
+                file.write(content)
+            os.replace(file_path + '.tmp', file_path)
+        print(f"Metrics file saved successfully. : {self.dir_metrics}")
+
+
+METRICS = Metrics()
+
+
 class FileAPI(CommonFunc):
     def __init__(self, sys_info, config, covid19):
         self.sys_info = sys_info
         self.covid19 = covid19
+        sys_config = config
         config = config['FILES']
         self.dir_download = config['dir_download']
         self.dir_result = config['dir_result']
         # self.dir_chart = config['dir_chart']
         self.file_name = config['file_name']
         self.file_list = []
+        self.failed_dates = []  # 데이터 없음이 아닌 오류(일시적인 오류, 제한 시간 초과)로 받지 못한 날짜
         self.result_file_name = config['result_file_name']
+        self.carry_forward = sys_config.getboolean('CACHE', 'carry_forward', fallback=True)
+        self.archive = XmlArchive(sys_config)
         self.exists_dir()
 
     def exists_dir(self):
@@ -104,6 +277,7 @@ class FileAPI(CommonFunc):
             os.mkdir(directory)
 
     def check_result(self):
+        # 기존 버전에서 생성한 결과 파일 확인 (현재는 RunLedger에 기록)
         file_path = self.set_txt_file_path()
         if not os.path.isfile(file_path):
             return True
@@ -111,23 +285,68 @@ class FileAPI(CommonFunc):
             print('Result file exists. : ' + file_path)
             return False
 
-    def set_date(self):
+    def get_date_list(self):
         start_date = date.today() - timedelta(days=12)  # 기간 설정
         end_date = date.today()
 
+        date_list = []
         while start_date <= end_date:
-            file_path = self.set_filepath(start_date)
-            if self.find_xml_file(start_date, file_path):
-                self.file_list.append(file_path)
+            date_list.append(start_date)
             start_date += timedelta(days=1)
+        return date_list
+
+    def set_date(self):
+        self.file_list = []
+        date_list = self.get_date_list()
+
+        found = self.download_files(date_list)
+        self.covid19.no_data.save()  # 이번 실행에서 확인한 데이터 없음 날짜를 한 번에 기록
+        # 일요일, 공휴일 등 데이터가 없는 날짜는 파일 목록에서 제외 (carry_forward: 추출 시 직전 발표일 값으로 채움)
+        self.file_list = [found[dates] for dates in date_list if found.get(dates)]
+        self.failed_dates = [dates for dates in date_list
+                             if not found.get(dates) and not self.covid19.no_data.contains(dates)]
 
         return self.file_list
 
+    def download_files(self, date_list):
+        # 파일이 없는 날짜만 스레드 풀에서 병렬로 다운로드 (전체 제한 시간: deadline)
+        from concurrent.futures import ThreadPoolExecutor, wait
+
+        # 반환값: 기준일자 -> 파일 경로 (일자별 파일 또는 월별 아카이브 내 항목), 없으면 False
+        found = {}
+        missing = []
+        for dates in date_list:
+            file_path = self.archive.locate(dates)
+            if file_path:
+                print('Xml file exists. : ' + file_path)
+                METRICS.inc('cache_hits', cache='xml_file')
+                found[dates] = file_path
+            else:
+                METRICS.inc('cache_misses', cache='xml_file')
+                missing.append(dates)
+
+        if not missing:
+            return found
+
+        workers = min(self.covid19.max_workers, len(missing))
+        deadline = time.monotonic() + self.covid19.deadline
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures = {executor.submit(self.find_xml_file_until, deadline, dates,
+                                   self.set_filepath(dates)): dates for dates in missing}
+        done, not_done = wait(futures, timeout=self.covid19.deadline)
+        # 요청 중인 작업은 제한 시각이 지나 재시도 없이 곧 끝나므로 종료를 기다림
+        # (반환 후에 파일 저장, 데이터 없음 기록이 일어나지 않도록 함)
+        executor.shutdown(wait=True, cancel_futures=True)
+
+        for future, dates in futures.items():
+            if future in not_done:
+                print(f"Download deadline exceeded. : {dates}")
+            found[dates] = False if future.cancelled() else future.result()
+
+        return found
+
     def set_filepath(self, date_time):
-        date_time = self.get_formatted_datetime(date_time, 1)
-        file_name = date_time + '_' + self.file_name
-        file_path = os.path.join(self.dir_download, file_name)
-        return file_path
+        return self.archive.set_filepath(date_time)
 
     def set_txt_file_path(self):
         dates = self.get_formatted_datetime(date.today(), 1)
@@ -135,48 +354,555 @@ class FileAPI(CommonFunc):
         file_path = os.path.join(self.dir_result, file_name)
         return file_path
 
+    def find_xml_file_until(self, deadline, dates, file_path):
+        with self.covid19.http.until(deadline):
+            return self.find_xml_file(dates, file_path)
+
     def find_xml_file(self, dates, file_path):
-        if not os.path.isfile(file_path):
+        located = self.archive.locate(dates)
+        if not located:
             response_body = Covid19API.http_get(self.covid19, dates)
             if response_body:
-                self.save_file(file_path, response_body, 'Xml')
-                return True
+                self.archive.write(file_path, response_body)
+                self.covid19.cache.bind(file_path, dates)
+                return file_path
             else:
                 return False
         else:
-            print('Xml file exists. : ' + file_path)
-            return True
+            print('Xml file exists. : ' + located)
+            return located
 
-    def find_txt_file(self):
-        file_path = self.set_txt_file_path()
-        if not os.path.isfile(file_path):
-            text_byte = 'ok'.encode('utf-8')
-            self.save_file(file_path, text_byte, 'Result')
-        else:
-            print(f"Result file exists. : ' {file_path}")
 
-    def save_file(self, file_path, data, text):
-        file = open(file_path, 'wb')
-        file.write(data)
-        file.close()
-        print(f"{text} file saved successfully. : {file_path}")
+class XmlArchive(CommonFunc):
+    # 응답 XML 보관
+    # - 일자별 파일: Download-Xml/YYYYMMDD_InfRegion.xml.gz (compress = false이면 .xml)
+    # - compact_after_days 이전 달의 일자별 파일은 월별 zip으로 압축 (zip 중앙 디렉터리로 항목 조회)
+    #   Download-Xml/Archive/YYYYMM_InfRegion.zip 내 YYYYMMDD_InfRegion.xml
+    #   → 파일 경로는 Download-Xml/Archive/YYYYMM_InfRegion.zip/YYYYMMDD_InfRegion.xml 형태로 표기
+    # - retention_days(0: 무기한) 이전 파일과 아카이브는 삭제
+    def __init__(self, config):
+        self.dir_download = config.get('FILES', 'dir_download')
+        self.file_name = config.get('FILES', 'file_name')
+        self.compress = config.getboolean('ARCHIVE', 'compress', fallback=True)
+        self.compact_after_days = config.getint('ARCHIVE', 'compact_after_days', fallback=35)
+        self.retention_days = config.getint('ARCHIVE', 'retention_days', fallback=0)
+        self.dir_archive = os.path.join(
+            self.dir_download, config.get('ARCHIVE', 'dir_archive', fallback='Archive'))
+
+    def set_filepath(self, dates):
+        file_name = self.get_formatted_datetime(dates, 1) + '_' + self.file_name
+        return os.path.join(self.dir_download, file_name + ('.gz' if self.compress else ''))
+
+    def set_archive_path(self, dates):
+        file_name = dates.strftime('%Y%m') + '_' + os.path.splitext(self.file_name)[0] + '.zip'
+        return os.path.join(self.dir_archive, file_name)
+
+    def locate(self, dates):
+        # 일자별 파일(gzip, 기존 xml) → 월별 아카이브 순으로 확인, 없으면 None
+        file_path = os.path.join(self.dir_download,
+                                 self.get_formatted_datetime(dates, 1) + '_' + self.file_name)
+        for candidate in (file_path + '.gz', file_path):
+            if os.path.isfile(candidate):
+                return candidate
+        archive_path = self.set_archive_path(dates)
+        member = os.path.basename(file_path)
+        if os.path.isfile(archive_path):
+            with zipfile.ZipFile(archive_path) as archive:
+                if member in archive.NameToInfo:
+                    return os.path.join(archive_path, member)
+        return None
+
+    @staticmethod
+    def split_member(file_path):
+        archive_path, member = os.path.split(file_path)
+        if archive_path.endswith('.zip') and os.path.isfile(archive_path):
+            return archive_path, member
+        return None, None
+
+    @staticmethod
+    def open(file_path):
+        # 압축을 풀지 않고 스트림으로 읽기 (iterparse에 그대로 전달)
+        archive_path, member = XmlArchive.split_member(file_path)
+        if archive_path:
+            with zipfile.ZipFile(archive_path) as archive:
+                return archive.open(member)
+        if file_path.endswith('.gz'):
+            return gzip.open(file_path, 'rb')
+        return open(file_path, 'rb')
+
+    @staticmethod
+    def source_name(file_path):
+        # 저장 형식과 무관하게 같은 기준일자는 같은 이름 (YYYYMMDD_InfRegion.xml)
+        file_name = os.path.basename(file_path)
+        return file_name[:-3] if file_name.endswith('.gz') else file_name
+
+    @staticmethod
+    def get_mtime(file_path):
+        archive_path, member = XmlArchive.split_member(file_path)
+        if archive_path:
+            with zipfile.ZipFile(archive_path) as archive:
+                return time.mktime(archive.getinfo(member).date_time + (0, 0, -1))
+        return os.path.getmtime(file_path)
+
+    def write(self, file_path, data):
+        temp_file = file_path + '.tmp'
+        with (gzip.open(temp_file, 'wb') if file_path.endswith('.gz') else open(temp_file, 'wb')) as file:
+            file.write(data)
+        os.replace(temp_file, file_path)
+        print(f"Xml file saved successfully. : {file_path}")
+
+    def get_file_date(self, text, fmt):
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            return None
+
+    def iter_daily_files(self):
+        suffix = '_' + self.file_name
+        for file_name in os.listdir(self.dir_download):
+            if file_name.endswith((suffix, suffix + '.gz')):
+                dates = self.get_file_date(file_name[:8], '%Y%m%d')
+                if dates:
+                    yield dates, os.path.join(self.dir_download, file_name)
+
+    def compact(self, today=None):
+        # 지난 달 일자별 파일을 월별 zip에 추가 후 삭제 (임시 파일에 쓰고 교체하여 중단 시에도 기존 아카이브 유지)
+        cutoff = (today or date.today()) - timedelta(days=self.compact_after_days)
+        months = {}
+        for dates, file_path in self.iter_daily_files():
+            if (dates.year, dates.month) < (cutoff.year, cutoff.month):
+                months.setdefault(self.set_archive_path(dates), []).append(file_path)
+
+        for archive_path, file_list in sorted(months.items()):
+            os.makedirs(self.dir_archive, exist_ok=True)
+            temp_file = archive_path + '.tmp'
+            with zipfile.ZipFile(temp_file, 'w', zipfile.ZIP_DEFLATED) as target:
+                if os.path.isfile(archive_path):
+                    with zipfile.ZipFile(archive_path) as source:
+                        for info in source.infolist():
+                            target.writestr(info, source.read(info))
+                for file_path in sorted(file_list):
+                    member = self.source_name(file_path)
+                    if member in target.NameToInfo:
+                        continue
+                    info = zipfile.ZipInfo(member, time.localtime(os.path.getmtime(file_path))[:6])
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    with self.open(file_path) as source:
+                        target.writestr(info, source.read())
+            os.replace(temp_file, archive_path)
+            for file_path in file_list:
+                os.remove(file_path)
+            print(f"Archive compacted {len(file_list)} files. : {archive_path}")
+            METRICS.inc('archive_compacted', len(file_list))
+
+    def apply_retention(self, today=None):
+        if self.retention_days <= 0:
+            return
+        cutoff = (today or date.today()) - timedelta(days=self.retention_days)
+        removed = [file_path for dates, file_path in self.iter_daily_files() if dates < cutoff]
+        if os.path.isdir(self.dir_archive):
+            for file_name in os.listdir(self.dir_archive):
+                month = self.get_file_date(file_name[:6], '%Y%m')
+                # 해당 월의 마지막 날도 보관 기간을 지난 아카이브만 삭제
+                if month and (month.replace(day=28) + timedelta(days=4)).replace(day=1) <= cutoff:
+                    removed.append(os.path.join(self.dir_archive, file_name))
+        for file_path in removed:
+            os.remove(file_path)
+            print(f"Archive retention removed. : {file_path}")
+        METRICS.inc('archive_removed', len(removed))
+
+    def maintain(self):
+        self.compact()
+        self.apply_retention()
+
+
+class LRUCache:
+    # 최근 사용 순으로 maxsize개까지 메모리에 보관 (API 응답, 슬래시 명령의 기간별 이력, 응답 메시지)
+    def __init__(self, name, maxsize):
+        self.name = name
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+        self.items = OrderedDict()
+
+    def get(self, key):
+        with self.lock:
+            value = self.items.get(key)
+            if value is not None:
+                self.items.move_to_end(key)
+        METRICS.inc('cache_hits' if value is not None else 'cache_misses', cache=self.name)
+        return value
+
+    def put(self, key, value):
+        with self.lock:
+            self.items[key] = value
+            self.items.move_to_end(key)
+            while len(self.items) > self.maxsize:
+                self.items.popitem(last=False)
+
+
+class ResponseCache:
+    # 취득한 응답을 기준일자별로 보관 (동일 날짜 재요청, XML 재파싱 방지)
+    # 데몬/슬래시 명령처럼 프로세스가 유지되는 경우에도 커지지 않도록 최근 maxsize일만 보관
+    def __init__(self, maxsize=64):
+        self.entries = LRUCache('response', maxsize)  # 기준일자 -> (응답 XML, 파싱된 XML root)
+        self.files = LRUCache('response_file', maxsize)  # 파일 경로 -> 기준일자
+
+    def get_body(self, dates):
+        entry = self.entries.get(dates)
+        return entry[0] if entry else None
+
+    def put(self, dates, response_body, root):
+        self.entries.put(dates, (response_body, root))
+
+    def bind(self, file_path, dates):
+        self.files.put(file_path, dates)
+
+    def get_root(self, file_path):
+        dates = self.files.get(file_path)
+        entry = self.entries.get(dates) if dates is not None else None
+        return entry[1] if entry else None
+
+
+class NegativeCache(CommonFunc):
+    # 데이터가 없는 기준일자를 기록하여 재요청 방지
+    # - TTL 이내에는 재요청하지 않음
+    # - 기준일자로부터 settled_days 이상 지난 뒤 확인한 날짜는 확정(재요청 안 함)
+    def __init__(self, config):
+        self.ttl = timedelta(hours=config.getfloat('CACHE', 'negative_ttl_hours', fallback=1))
+        self.settled_days = config.getint('CACHE', 'settled_days', fallback=7)
+        self.cache_file = os.path.join(
+            config.get('FILES', 'dir_download'),
+            config.get('CACHE', 'negative_cache_file', fallback='NoData.json'))
+        self.lock = threading.Lock()
+        self.entries = self.load()
+        self.dirty = False  # 변경 사항은 save() 호출 시 한 번에 기록 (실행/청크 단위)
+
+    def load(self):
+        if not os.path.isfile(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError) as error:
+            print(f"Failed to load no-data cache: {error}")
+            return {}
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            os.makedirs(os.path.dirname(self.cache_file) or '.', exist_ok=True)
+            temp_file = self.cache_file + '.tmp'
+            with open(temp_file, 'w', encoding='utf-8') as file:
+                json.dump(self.entries, file, ensure_ascii=False, indent=2, sort_keys=True)
+            os.replace(temp_file, self.cache_file)
+            self.dirty = False
+
+    def is_settled(self, dates, checked):
+        return (checked.date() - dates).days >= self.settled_days
+
+    def contains(self, dates):
+        with self.lock:
+            entry = self.entries.get(self.get_formatted_datetime(dates, 2))
+        if entry is None:
+            return False
+        checked = datetime.strptime(entry['checked'], '%Y-%m-%d %H:%M:%S')
+        hit = entry['settled'] or datetime.now() - checked < self.ttl
+        METRICS.inc('cache_hits' if hit else 'cache_misses', cache='no_data')
+        return hit
+
+    def add(self, dates):
+        checked = datetime.now()
+        with self.lock:
+            self.entries[self.get_formatted_datetime(dates, 2)] = {
+                'checked': self.get_formatted_datetime(checked, 3),
+                'settled': self.is_settled(dates, checked),
+            }
+            self.dirty = True
+
+    def discard(self, dates):
+        with self.lock:
+            if self.entries.pop(self.get_formatted_datetime(dates, 2), None):
+                self.dirty = True
+
+
+class RetryLater(Exception):
+    # 일시적인 오류 (재시도 대상), retry_after: 서버가 지정한 대기 시간(초)
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitOpen(Exception):
+    pass
+
+
+class CircuitBreaker(CommonFunc):
+    # 연속 실패가 threshold 이상이면 cooldown 동안 요청 차단 (open)
+    # cooldown 이후 한 요청만 시험(half_open)하여 성공 시 복구, 실패 시 다시 차단
+    # 상태는 파일에 저장하여 다음 실행(cron, 데몬 재시작)에도 유지
+    def __init__(self, config, name):
+        self.name = name
+        self.threshold = config.getint(name, 'breaker_threshold', fallback=5)
+        self.cooldown = config.getfloat(name, 'breaker_cooldown', fallback=600)
+        self.state_file = os.path.join(
+            config.get('FILES', 'dir_download'),
+            config.get(name, 'breaker_file', fallback='Breaker.json'))
+        self.lock = threading.Lock()
+        self.state = self.load()
+
+    def load(self):
+        default = {'state': 'closed', 'failures': 0, 'opened': None}
+        if not os.path.isfile(self.state_file):
+            return default
+        try:
+            with open(self.state_file, encoding='utf-8') as file:
+                return json.load(file).get(self.name, default)
+        except (OSError, ValueError) as error:
+            print(f"Failed to load circuit breaker state: {error}")
+            return default
+
+    def save(self):
+        states = {}
+        if os.path.isfile(self.state_file):
+            with contextlib.suppress(OSError, ValueError), \
+                    open(self.state_file, encoding='utf-8') as file:
+                states = json.load(file)
+        states[self.name] = self.state
+        os.makedirs(os.path.dirname(self.state_file) or '.', exist_ok=True)
+        temp_file = self.state_file + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as file:
+            json.dump(states, file, indent=2, sort_keys=True)
+        os.replace(temp_file, self.state_file)
+
+    def allow(self):
+        with self.lock:
+            if self.state['state'] == 'closed':
+                return True
+            if self.state['state'] == 'open':
+                opened = datetime.strptime(self.state['opened'], '%Y-%m-%d %H:%M:%S')
+                if (datetime.now() - opened).total_seconds() >= self.cooldown:
+                    self.state['state'] = 'half_open'
+                    return True
+            return False
+
+    def is_half_open(self):
+        with self.lock:
+            return self.state['state'] == 'half_open'
+
+    def record_success(self):
+        with self.lock:
+            if self.state['state'] == 'closed' and self.state['failures'] == 0:
+                return
+            if self.state['state'] != 'closed':
+                print(f"Circuit closed. : {self.name}")
+            self.state = {'state': 'closed', 'failures': 0, 'opened': None}
+            self.save()
+
+    def record_failure(self):
+        with self.lock:
+            self.state['failures'] += 1
+            if self.state['state'] == 'half_open' or self.state['failures'] >= self.threshold:
+                if self.state['state'] != 'open':
+                    print(f"Circuit opened for {self.cooldown:g}s. : {self.name}")
+                    METRICS.inc('circuit_opened', target=self.name.lower())
+                self.state['state'] = 'open'
+                self.state['opened'] = self.get_formatted_datetime(datetime.now(), 3)
+            self.save()
+
+
+class HttpClient:
+    # keep-alive 커넥션, 연결/읽기 타임아웃, 지터를 둔 지수 백오프 재시도, Retry-After, 서킷 브레이커
+    # until(deadline): 해당 스레드의 요청은 deadline(time.monotonic 기준)까지만 재시도/대기
+    RETRY_STATUS = (429, 500, 502, 503, 504)
+
+    def __init__(self, config, name):
+        self.name = name
+        self.breaker = CircuitBreaker(config, name)
+        config = config[name]
+        timeout = config.getfloat('timeout', 10)
+        self.connect_timeout = config.getfloat('connect_timeout', timeout)
+        self.read_timeout = config.getfloat('read_timeout', timeout)
+        self.max_retries = config.getint('max_retries', 3)
+        self.retry_backoff = config.getfloat('retry_backoff', 1)
+        self.retry_max_backoff = config.getfloat('retry_max_backoff', 30)
+        self.local = threading.local()  # 스레드별 keep-alive 커넥션, 제한 시각
+
+    @contextlib.contextmanager
+    def until(self, deadline):
+        previous = getattr(self.local, 'deadline', None)
+        self.local.deadline = deadline
+        try:
+            yield
+        finally:
+            self.local.deadline = previous
+
+    def get_deadline(self):
+        return getattr(self.local, 'deadline', None)
+
+    def get_remaining(self):
+        # 제한 시각까지 남은 시간(초), 제한이 없으면 None
+        deadline = self.get_deadline()
+        return None if deadline is None else deadline - time.monotonic()
+
+    def get_timeout(self, timeout):
+        remaining = self.get_remaining()
+        return timeout if remaining is None else max(0.1, min(timeout, remaining))
+
+    def get_connection(self, url):
+        from http import client
+
+        connections = getattr(self.local, 'connections', None)
+        if connections is None:
+            connections = self.local.connections = {}
+        key = (url.scheme, url.netloc)
+        if key not in connections:
+            if url.scheme == 'https':
+                connections[key] = client.HTTPSConnection(url.netloc, timeout=self.connect_timeout)
+            else:
+                connections[key] = client.HTTPConnection(url.netloc, timeout=self.connect_timeout)
+        return connections[key]
+
+    def close_connection(self, url):
+        connections = getattr(self.local, 'connections', {})
+        conn = connections.pop((url.scheme, url.netloc), None)
+        if conn is not None:
+            conn.close()
+
+    def get_backoff(self, attempt, retry_after=None):
+        if retry_after is not None:
+            return retry_after
+        # 지터를 적용한 뒤 최대 대기 시간으로 제한
+        return min(self.retry_max_backoff, self.retry_backoff * (2 ** attempt) * random.uniform(0.5, 1.5))
+
+    @staticmethod
+    def get_retry_after(value):
+        # Retry-After: 초 또는 HTTP-date
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        from email.utils import parsedate_to_datetime
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def get(self, url, validate=None):
+        return self.call('GET', url, validate)
+
+    def post(self, url, body, headers, validate=None):
+        return self.call('POST', url, validate, body, headers)
+
+    def call(self, method, url, validate=None, body=None, headers=None):
+        # validate(status, body): 응답 확인 후 결과 반환, 일시적 오류이면 RetryLater 발생
+        # 서킷 브레이커에는 요청 단위로 기록 (재시도까지 실패한 경우 실패 1회, 404 등 4xx 응답은 기록 안 함)
+        from http import client
+
+        attempt = 0
+        while True:
+            remaining = self.get_remaining()
+            if remaining is not None and remaining <= 0:
+                raise RetryLater(f"Deadline exceeded. : {self.name}")
+            if not self.breaker.allow():
+                METRICS.inc('circuit_rejected', target=self.name.lower())
+                raise CircuitOpen(f"Circuit open, skip request. : {self.name}")
+            try:
+                response, response_body = self.request(url, method=method, body=body,
+                                                        headers=headers)
+                retry_after = self.get_retry_after(response.getheader('Retry-After'))
+                if response.status in self.RETRY_STATUS:
+                    raise RetryLater(f"HTTP {response.status}", retry_after)
+                result = validate(response.status, response_body) if validate else response_body
+                if response.status < 400:
+                    self.breaker.record_success()
+                return result
+            except (RetryLater, OSError, client.HTTPException) as error:
+                retry_after = getattr(error, 'retry_after', None)
+                # 시험 요청(half_open)은 재시도하지 않음, 서버가 지정한 대기 시간이 최대 대기 시간보다 길면 중단
+                if attempt >= self.max_retries or self.breaker.is_half_open() or \
+                        (retry_after or 0) > self.retry_max_backoff:
+                    self.breaker.record_failure()
+                    raise
+                backoff = self.get_backoff(attempt, retry_after)
+                remaining = self.get_remaining()
+                if remaining is not None and backoff >= remaining:
+                    # 제한 시각 전에 다시 요청할 수 없으면 중단 (서버 실패로 기록하지 않음)
+                    raise
+                print(f"Retry in {backoff:.1f}s ({attempt + 1}/{self.max_retries}) : {error}")
+                METRICS.inc('retries', target=self.name.lower())
+                time.sleep(backoff)
+                attempt += 1
+
+    def request(self, url, max_redirects=3, method='GET', body=None, headers=None):
+        from http import client
+
+        url = parse.urlsplit(url)
+        for _ in range(max_redirects + 1):
+            path = url.path + ('?' + url.query if url.query else '')
+            try:
+                response, response_body = self.send(url, path, method, body, headers)
+            except (client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # 서버가 끊은 keep-alive 커넥션은 새로 연결하여 한 번 더 요청
+                METRICS.inc('retries', target=self.name.lower())
+                response, response_body = self.send(url, path, method, body, headers)
+
+            location = response.getheader('Location')
+            if response.status in (301, 302, 303, 307, 308) and location:
+                url = parse.urlsplit(parse.urljoin(url.geturl(), location))
+                continue
+            return response, response_body
+
+        raise client.HTTPException(f"Too many redirects: {url.geturl()}")
+
+    def send(self, url, path, method='GET', body=None, headers=None):
+        conn = self.get_connection(url)
+        try:
+            with METRICS.span('http', target=self.name.lower()):
+                if conn.sock is None:
+                    # 연결은 connect_timeout, 이후 응답 읽기는 read_timeout 적용 (제한 시각까지 남은 시간 이내)
+                    conn.timeout = self.get_timeout(self.connect_timeout)
+                    conn.connect()
+                conn.sock.settimeout(self.get_timeout(self.read_timeout))
+                conn.request(method, path, body, headers or {})
+                response = conn.getresponse()
+                response_body = response.read()
+            METRICS.inc('bytes_downloaded', len(response_body), target=self.name.lower())
+            return response, response_body
+        except Exception:
+            self.close_connection(url)
+            raise
 
 
 class Covid19API(CommonFunc):
+    # resultCode - 00: 정상, 03: 데이터 없음
+    # 01: 어플리케이션 에러, 02: DB 에러, 04: HTTP 에러, 05: 서비스 연결실패,
+    # 22: 서비스 요청제한횟수 초과, 99: 기타 에러 → 나중에 다시 요청
+    NO_DATA_CODES = ('00', '03')
+    RETRY_CODES = ('01', '02', '04', '05', '22', '99')
+
     def __init__(self, sys_info, config):
+        self.no_data = NegativeCache(config)
+        self.http = HttpClient(config, 'COVID19')
+        self.cache = ResponseCache(config.getint('CACHE', 'response_cache_size', fallback=64))
         config = config['COVID19']
         self.sys_info = sys_info
         self.service_key = config['decoding_key']
         self.url = config['url']
+        self.deadline = config.getfloat('deadline', 60)
+        self.max_workers = config.getint('max_workers', 4)
+        self.num_of_rows = config.getint('num_of_rows', 500)
 
-    def set_covid19uri(self, dates):
+    def set_covid19uri(self, dates, page_no=1):
         params = '?' + parse.urlencode({
             # ✔ 서비스키
             parse.quote_plus('serviceKey'): parse.unquote(self.service_key),
             # ✔ 페이지 번호
-            parse.quote_plus('pageNo'): '1',
+            parse.quote_plus('pageNo'): str(page_no),
             # ✔ 한 페이지 결과 수
-            parse.quote_plus('numOfRows'): '500',
+            parse.quote_plus('numOfRows'): str(self.num_of_rows),
             # 데이터유형
             parse.quote_plus('apiType'): 'xml',
             # 기준일자
@@ -186,81 +912,266 @@ class Covid19API(CommonFunc):
         return params
 
     def http_get(self, params):
+        response_body = self.cache.get_body(params)
+        if response_body:
+            return response_body
+        if self.no_data.contains(params):
+            print(f"No data (cached). : {self.get_formatted_datetime(params, 2)}")
+            return False
+
+        response_body, no_data = self.fetch(params)
+        if response_body:
+            self.no_data.discard(params)
+            return response_body
+        if no_data:
+            self.no_data.add(params)
+        return False
+
+    def parse_response(self, status, response_body):
+        # 반환값: (XML tree, 응답 XML) 또는 None
+        if status != 200:
+            print(f"Unexpected status: {status}")
+            return None
         try:
-            request = r.Request(self.url + self.set_covid19uri(params))
-            request.get_method = lambda: 'GET'
-            response = r.urlopen(request)
-            response_body = response.read()
             tree = ET.fromstring(response_body)
-            result_code = tree.findtext('header/resultCode')
+        except ET.ParseError as error:
+            # 과부하 시 XML 대신 오류 페이지를 반환하는 경우가 있어 재시도
+            raise RetryLater(f"Failed to parse response: {error}")
+        # 인증키 오류 등은 OpenAPI_ServiceResponse/cmmMsgHeader 형식으로 응답
+        result_code = tree.findtext('header/resultCode') or \
+            tree.findtext('cmmMsgHeader/returnReasonCode')
+        if result_code in self.RETRY_CODES:
+            result_msg = tree.findtext('header/resultMsg') or tree.findtext('cmmMsgHeader/errMsg')
+            raise RetryLater(f"resultCode {result_code} {result_msg}")
+        return tree, response_body
+
+    def fetch(self, params, use_cache=True):
+        # 반환값: (응답 XML 또는 None, 데이터 없음 여부)
+        # 데이터 없음(resultCode 00 + item 없음, 03)과 나중에 다시 요청할 오류를 구분
+        from http import client
 
-            if response.status == 200 and result_code == '00' and tree.findtext('body/items/item'):
-                # print(response.headers) # Date, Server, Content-Length, Connection, Content-Type
-                # print('response.url : ' + response.url) # redirection url
-                return response_body
+        try:
+            response = self.http.get(self.url + self.set_covid19uri(params), self.parse_response)
+            if response is None:
+                return None, False
+            tree, response_body = response
+            result_code = tree.findtext('header/resultCode') or \
+                tree.findtext('cmmMsgHeader/returnReasonCode')
+
+            if result_code == '00' and tree.findtext('body/items/item'):
+                if self.get_page_count(tree) > 1:
+                    response_body = self.fetch_pages(params, tree)
+                    if response_body is None:
+                        return None, False
+                if use_cache:
+                    self.cache.put(params, response_body, tree)
+                return response_body, False
+            elif result_code in self.NO_DATA_CODES:
+                # 질병관리청에서 일요일과 공휴일 통계를 발표하지 않기로 함에 따라 데이터 취득 불가능
+                # (2023년 6월 1일~ 주 단위 업데이트) → NegativeCache에 기록 (carry_forward: 직전 발표일 값으로 채움)
+                return None, True
             else:
-                return False
-                # TODO: 질병관리청에서 일요일과 공휴일 통계를 발표하지 않기로 함에 따라 데이터 취득 불가능
-                # 처리 플래그 설정 필요, 이전 날짜의 파일을 리스트에 추가해야함. 다른 방법이 있는지 확인
-        except URLError as error:
+                print(f"API error: resultCode {result_code}")
+                return None, False
+        except CircuitOpen as error:
+            print(error)
+            return None, False
+        except RetryLater as error:
+            print(f"API unavailable, retry later: {error}")
+            return None, False
+        except (OSError, client.HTTPException) as error:
             print(f"Failed to make request: {error}")
-            return False
-        except ET.ParseError as error:
-            print(f"Failed to parse response: {error}")
-            return False
+            return None, False
+
+    def get_page_count(self, tree):
+        total_count = int(tree.findtext('body/totalCount') or 0)
+        num_of_rows = int(tree.findtext('body/numOfRows') or self.num_of_rows)
+        return -(-total_count // num_of_rows) if num_of_rows > 0 else 1
+
+    def fetch_page(self, params, page_no):
+        from http import client
+
+        response = self.http.get(self.url + self.set_covid19uri(params, page_no), self.parse_response)
+        if response is None or response[0].findtext('header/resultCode') != '00':
+            raise client.HTTPException(f"Page {page_no} failed")
+        return response[0].findall('body/items/item')
+
+    def fetch_pages(self, params, tree):
+        # 첫 페이지의 totalCount 기준으로 나머지 페이지를 병렬 취득 후 페이지 순서대로 병합
+        # 한 페이지라도 실패하면 일부만 저장되지 않도록 전체를 실패 처리 (반환값: None)
+        from concurrent.futures import ThreadPoolExecutor
+
+        page_count = self.get_page_count(tree)
+        print(f"Fetch {page_count} pages. : {self.get_formatted_datetime(params, 2)}")
+        deadline = self.http.get_deadline()  # 요청한 스레드의 제한 시각을 페이지 요청에도 적용
+
+        def fetch_page(page_no):
+            with self.http.until(deadline):
+                return self.fetch_page(params, page_no)
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, page_count - 1)) as executor:
+            pages = executor.map(fetch_page, range(2, page_count + 1))
+            items = tree.find('body/items')
+            for page in pages:
+                items.extend(page)
+        METRICS.inc('pages_fetched', page_count, target='covid19')
+
+        total_count = int(tree.findtext('body/totalCount'))
+        if len(items) != total_count:
+            print(f"Page merge mismatch : {len(items)} / {total_count}")
+            return None
+        if tree.find('body/numOfRows') is not None:
+            tree.find('body/numOfRows').text = str(total_count)
+        return ET.tostring(tree, encoding='utf-8')
+
+
+# 게시에 사용하는 항목만 추출한 레코드 (stdDay: date, 건수: int, 10만명당발생율: float)
+CovidRecord = namedtuple('CovidRecord', [
+    'std_day', 'gubun', 'gubun_en', 'def_cnt', 'inc_dec', 'local_occ_cnt', 'over_flow_cnt',
+    'death_cnt', 'qur_rate'])
+
+
+def to_float(text):
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+class XmlRecordReader:
+    # XML 태그 -> (레코드 필드, 변환 함수)
+    FIELDS = {
+        'stdDay': ('std_day', lambda text: datetime.strptime(text, '%Y-%m-%d').date()),
+        'gubun': ('gubun', str),
+        'gubunEn': ('gubun_en', str),
+        'defCnt': ('def_cnt', int),
+        'incDec': ('inc_dec', int),
+        'localOccCnt': ('local_occ_cnt', int),
+        'overFlowCnt': ('over_flow_cnt', int),
+        'deathCnt': ('death_cnt', int),
+        'qurRate': ('qur_rate', to_float),
+    }
+
+    def __init__(self, regions=None):
+        self.regions = set(regions) if regions else None
+
+    def make_record(self, values):
+        fields = dict.fromkeys(CovidRecord._fields)
+        for tag, text in values.items():
+            name, convert = self.FIELDS[tag]
+            fields[name] = convert(text.strip()) if text and text.strip() else None
+        return CovidRecord(**fields)
+
+    def accept(self, values):
+        return self.regions is None or values.get('gubunEn') in self.regions
+
+    def iter_file(self, source):
+        # iterparse로 item 단위 처리 후 즉시 해제 (파일 크기와 무관하게 메모리 일정)
+        values = {}
+        parent = None
+        for event, elem in ET.iterparse(source, events=('start', 'end')):
+            if event == 'start':
+                if elem.tag == 'items':
+                    parent = elem
+                continue
+            if elem.tag in self.FIELDS:
+                values[elem.tag] = elem.text
+            elif elem.tag == 'item':
+                if self.accept(values):
+                    yield self.make_record(values)
+                values = {}
+                elem.clear()
+                if parent is not None:
+                    parent.remove(elem)
+
+    def iter_root(self, root):
+        # 이미 파싱된 root는 item의 자식 노드를 한 번씩만 순회
+        for item in root.iterfind('body/items/item'):
+            values = {child.tag: child.text for child in item if child.tag in self.FIELDS}
+            if self.accept(values):
+                yield self.make_record(values)
 
 
 class ReadXmlData(CommonFunc):
-    def __init__(self, file_list):
+    def __init__(self, file_list, cache=None, store=None, date_list=None):
         self.file_list = file_list
-        self.today = self.get_formatted_datetime(date.today(), 2)
-
-    def get_root_from_file(self, file):
-        tree = ET.parse(file)
-        return tree.getroot()
+        self.cache = cache
+        self.store = store
+        self.date_list = date_list  # 지정 시 기간 내 데이터가 없는 날짜를 직전 발표일 값으로 채움
+        self.today = date.today()
+
+    def get_records(self, file, regions=None):
+        reader = XmlRecordReader(regions)
+        root = self.cache.get_root(file) if self.cache else None
+        if root is not None:
+            return reader.iter_root(root)
+        return self.iter_file_records(reader, file)
+
+    def iter_file_records(self, reader, file):
+        with XmlArchive.open(file) as source:
+            yield from reader.iter_file(source)
+
+    def iter_window_records(self, regions):
+        if self.store is None:
+            for file in self.file_list:
+                yield from self.get_records(file, regions)
+            return
+
+        # 신규 파일만 저장소에 반영 후 파일 목록의 기준일자 범위를 한 번에 조회
+        for file in self.file_list:
+            if not self.store.is_ingested(file):
+                METRICS.inc('cache_misses', cache='store')
+                self.store.ingest(file, self.get_records(file))
+            else:
+                METRICS.inc('cache_hits', cache='store')
+        yield from self.store.get_window(self.file_list, regions)
 
     def get_data(self):
         total_stdday_list = []
         total_incdec_list = []
         data_cnt = {}
-        data_dict = {}
-        for file in self.file_list:
-            root = self.get_root_from_file(file)
-            sido = 'Incheon'
-
-            for data in root.findall('body/items/item'):
-                if data.findtext('gubunEn') == 'Total':
-                    # dict['시도명'] = data.findtext('gubun')
-                    # dict['시도명(영문)'] = data.findtext('gubunEn')
-                    data_dict['전일대비확진자증감수'] = data.findtext('incDec')
-                    # dict['누적격리해제수'] = data.findtext('isolClearCnt') # data값 전부 0
-                    # dict['격리중환자수'] = data.findtext('isolIngCnt') # data값 전부 0
-                    # dict['10만명당발생율'] = data.findtext('qurRate')
-                    # 기준일자 포맷 변경 시
-                    # stdDay_str = data.findtext('stdDay')
-                    # dict['기준일자'] = stdDay_str[-5:].replace('-', '/')
-                    data_dict['기준일자'] = data.findtext('stdDay')
-                    total_stdday_list.append(data_dict['기준일자'])
-                    total_incdec_list.append(data_dict['전일대비확진자증감수'])
-                if data.findtext('stdDay') == self.today and data.findtext('gubunEn') == 'Total':
-                    data_cnt['누적확진자수'] = self.str_to_int(
-                        data.findtext('defCnt'))
-                    data_cnt['전일대비확진자증감수'] = self.str_to_int(
-                        data.findtext('incDec'))
-                    data_cnt['지역발생수'] = self.str_to_int(
-                        data.findtext('localOccCnt'))
-                    data_cnt['해외유입수'] = self.str_to_int(
-                        data.findtext('overFlowCnt'))
-                    data_cnt['사망자수'] = self.str_to_int(
-                        data.findtext('deathCnt'))
-                if data.findtext('stdDay') == self.today and data.findtext('gubunEn') == sido:
-                    data_cnt[sido] = self.str_to_int(
-                        data.findtext('incDec'))
+        sido = 'Incheon'
+        for record in self.iter_window_records(('Total', sido)):
+            if record.gubun_en == 'Total':
+                # 기준일자 포맷 변경 시 get_formatted_datetime(record.std_day, 7) 등으로 변경
+                total_stdday_list.append(self.get_formatted_datetime(record.std_day, 2))
+                total_incdec_list.append(str(record.inc_dec))
+            if record.std_day == self.today and record.gubun_en == 'Total':
+                data_cnt['누적확진자수'] = self.str_to_int(record.def_cnt)
+                data_cnt['전일대비확진자증감수'] = self.str_to_int(record.inc_dec)
+                data_cnt['지역발생수'] = self.str_to_int(record.local_occ_cnt)
+                data_cnt['해외유입수'] = self.str_to_int(record.over_flow_cnt)
+                data_cnt['사망자수'] = self.str_to_int(record.death_cnt)
+            if record.std_day == self.today and record.gubun_en == sido:
+                data_cnt[sido] = self.str_to_int(record.inc_dec)
 
         unique_stdday, unique_incdec = self.remove_duplicates(
             total_stdday_list, total_incdec_list)
+        if self.date_list:
+            unique_stdday, unique_incdec, carried = self.carry_forward(unique_stdday, unique_incdec)
+            if carried:
+                print('Carried forward from previous published day. : ' + ', '.join(carried))
+                data_cnt['carried_forward'] = carried
         return unique_stdday, unique_incdec, data_cnt
 
+    def carry_forward(self, stdday_list, incdec_list):
+        # 데이터가 없는 날짜마다 직전 발표일의 값으로 해당 날짜 행을 추가 (첫 발표일 이전 날짜는 제외)
+        # 반환값: (기준일자 리스트, 증감수 리스트, 채운 기준일자 리스트)
+        published = dict(zip(stdday_list, incdec_list))
+        labels = set(stdday_list) | {self.get_formatted_datetime(dates, 2) for dates in self.date_list}
+        filled_stdday, filled_incdec, carried = [], [], []
+        previous = None
+        for label in sorted(labels):
+            if label in published:
+                previous = published[label]
+            elif previous is None:
+                continue
+            else:
+                carried.append(label)
+            filled_stdday.append(label)
+            filled_incdec.append(previous)
+        return filled_stdday, filled_incdec, carried
+
     def remove_duplicates(self, total_stdday_list, total_incdec_list):
         # 중복되지 않은 stdDay 리스트와 그에 맞는 incdec 리스트를 저장할 변수 초기화
         unique_stdday_list = []
@@ -275,135 +1186,756 @@ class ReadXmlData(CommonFunc):
         return unique_stdday_list, unique_incdec_list
 
 
-class ChartAPI(CommonFunc):
+class CovidStore(CommonFunc):
+    # 일자/시도별 통계를 누적 저장 (XML 파일은 최초 1회만 파싱하여 반영)
+    COLUMNS = CovidRecord._fields
+
     def __init__(self, config):
-        # matplotlib 한글깨짐 방지
-        font_list = [font.name for font in fm.fontManager.ttflist]
-        if 'Malgun Gothic' in font_list:
-            plt.rcParams['font.family'] = 'Malgun Gothic'  # Windows OS
-        elif 'NanumGothic' in font_list:
-            plt.rcParams['font.family'] = 'NanumGothic'
+        self.db_file = config.get('FILES', 'store_file', fallback='Covid19.db')
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS records (
+                std_day TEXT NOT NULL,
+                gubun TEXT,
+                gubun_en TEXT NOT NULL,
+                def_cnt INTEGER,
+                inc_dec INTEGER,
+                local_occ_cnt INTEGER,
+                over_flow_cnt INTEGER,
+                death_cnt INTEGER,
+                qur_rate REAL,
+                PRIMARY KEY (std_day, gubun_en)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS sources (
+                file_name TEXT PRIMARY KEY,
+                mtime REAL NOT NULL,
+                first_day TEXT,
+                last_day TEXT
+            );
+        """)
+
+    def source_key(self, file_path):
+        return XmlArchive.source_name(file_path), XmlArchive.get_mtime(file_path)
+
+    def is_ingested(self, file_path):
+        file_name, mtime = self.source_key(file_path)
+        with self.lock:
+            row = self.conn.execute('SELECT mtime FROM sources WHERE file_name = ?',
+                                    (file_name,)).fetchone()
+        return row is not None and row[0] == mtime
+
+    def ingest(self, file_path, records):
+        file_name, mtime = self.source_key(file_path)
+        rows = [self.to_row(record) for record in records if record.std_day]
+        days = [row[0] for row in rows]
+        with self.lock, self.conn:
+            self.insert_rows(rows)
+            self.conn.execute(
+                'INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?)',
+                (file_name, mtime, min(days, default=None), max(days, default=None)))
+        print(f"Store ingested {len(rows)} rows. : {file_name}")
+
+    def ingest_records(self, records):
+        # 파일 없이 응답에서 바로 반영 (대량 백필)
+        rows = [self.to_row(record) for record in records if record.std_day]
+        with self.lock, self.conn:
+            self.insert_rows(rows)
+        return len(rows)
+
+    def insert_rows(self, rows):
+        placeholders = ', '.join('?' * len(self.COLUMNS))
+        self.conn.executemany(f"INSERT OR REPLACE INTO records VALUES ({placeholders})", rows)
+
+    def get_days(self, start_date, end_date):
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT DISTINCT std_day FROM records WHERE std_day BETWEEN ? AND ?',
+                (start_date.isoformat(), end_date.isoformat())).fetchall()
+        return {date.fromisoformat(row[0]) for row in rows}
+
+    def to_row(self, record):
+        return (record.std_day.isoformat(),) + tuple(record[1:])
+
+    def to_record(self, row):
+        return CovidRecord(date.fromisoformat(row[0]), *row[1:])
+
+    def get_range(self, file_list):
+        names = [XmlArchive.source_name(file) for file in file_list]
+        if not names:
+            return None, None
+        with self.lock:
+            return self.conn.execute(
+                f"SELECT MIN(first_day), MAX(last_day) FROM sources "
+                f"WHERE file_name IN ({', '.join('?' * len(names))})", names).fetchone()
+
+    def get_window(self, file_list, regions=None):
+        first_day, last_day = self.get_range(file_list)
+        if first_day is None:
+            return []
+        return self.query(date.fromisoformat(first_day), date.fromisoformat(last_day), regions)
+
+    def query(self, start_date, end_date, regions=None):
+        sql = f"SELECT {', '.join(self.COLUMNS)} FROM records WHERE std_day BETWEEN ? AND ?"
+        args = [start_date.isoformat(), end_date.isoformat()]
+        if regions:
+            sql += f" AND gubun_en IN ({', '.join('?' * len(regions))})"
+            args += list(regions)
+        sql += ' ORDER BY std_day'
+        with self.lock:
+            rows = self.conn.execute(sql, args).fetchall()
+        return [self.to_record(row) for row in rows]
+
+
+class RegionAnalytics(CommonFunc):
+    # 기간 전체를 (일자 × 시도) NumPy 행렬로 한 번에 적재하여 시도별 지표를 벡터 연산으로 계산
+    # - 일일 증감(incDec), 7일 이동평균, 전주대비 증감률, 10만명당 일일 발생률
+    def __init__(self, store):
+        import numpy as np
+
+        self.np = np
+        self.store = store
+        self.days = []
+        self.regions = []
+        self.names = {}
+
+    def to_matrix(self, records, rows, cols, field):
+        np = self.np
+        matrix = np.full((len(self.days), len(self.regions)), np.nan)
+        values = np.fromiter((np.nan if getattr(record, field) is None else getattr(record, field)
+                              for record in records), dtype=float, count=len(records))
+        matrix[rows, cols] = values
+        return matrix
+
+    def load(self, start_date, end_date):
+        np = self.np
+        records = self.store.query(start_date, end_date)
+        self.days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+        self.regions = sorted({record.gubun_en for record in records})
+        self.names = {record.gubun_en: record.gubun for record in records}
+        index = {region: i for i, region in enumerate(self.regions)}
+        rows = np.fromiter(((record.std_day - start_date).days for record in records),
+                           dtype=np.int64, count=len(records))
+        cols = np.fromiter((index[record.gubun_en] for record in records),
+                           dtype=np.int64, count=len(records))
+
+        self.inc_dec = self.to_matrix(records, rows, cols, 'inc_dec')
+        self.def_cnt = self.to_matrix(records, rows, cols, 'def_cnt')
+        self.qur_rate = self.to_matrix(records, rows, cols, 'qur_rate')
+        self.compute()
+        return self
+
+    def compute(self):
+        np = self.np
+        valid = ~np.isnan(self.inc_dec)
+        zero = np.zeros((1, len(self.regions)))
+        sums = np.vstack([zero, np.cumsum(np.where(valid, self.inc_dec, 0), axis=0)])
+        counts = np.vstack([zero, np.cumsum(valid, axis=0)])
+
+        # 7일 이동평균 (발표가 없는 날짜는 제외하고 평균)
+        end = np.arange(len(self.days)) + 1
+        start = np.maximum(end - 7, 0)
+        window_sum = sums[end] - sums[start]
+        window_count = counts[end] - counts[start]
+        self.avg7 = np.full_like(window_sum, np.nan)
+        np.divide(window_sum, window_count, out=self.avg7, where=window_count > 0)
+
+        # 전주대비 증감률 (7일 이동평균 기준)
+        self.wow = np.full_like(self.avg7, np.nan)
+        if len(self.days) > 7:
+            previous = self.avg7[:-7]
+            np.divide(self.avg7[7:], previous, out=self.wow[7:],
+                      where=~np.isnan(previous) & (previous > 0))
+            self.wow[7:] -= 1
+
+        # 10만명당 일일 발생률 (qurRate = 누적확진자 / 인구 × 10만)
+        self.per_100k = np.full_like(self.inc_dec, np.nan)
+        np.divide(self.inc_dec * self.qur_rate, self.def_cnt, out=self.per_100k,
+                  where=(self.def_cnt > 0) & ~np.isnan(self.qur_rate))
+        self.valid = valid
+
+    def latest_day(self):
+        rows = self.np.flatnonzero(self.valid.any(axis=1))
+        return int(rows[-1]) if len(rows) else None
+
+    def get_summary(self, regions):
+        # 마지막 발표일 기준 시도별 지표
+        row = self.latest_day()
+        index = {region: i for i, region in enumerate(self.regions)}
+        summary = []
+        for region in regions:
+            col = index.get(region)
+            values = {}
+            for key, matrix in (('inc_dec', self.inc_dec), ('avg7', self.avg7),
+                                ('wow', self.wow), ('per_100k', self.per_100k)):
+                value = None if row is None or col is None else matrix[row, col]
+                values[key] = None if value is None or self.np.isnan(value) else float(value)
+            summary.append(dict(values, gubun_en=region, gubun=self.names.get(region, region)))
+        return summary
+
+
+class AlertEngine(CommonFunc):
+    # 시도별 경보 규칙 ([ALERT:gubunEn] avg7_above, growth_above)을 평가하여 상태가 바뀐 경우만 반환
+    # - 시도별 최근 7일 값, 7일 평균, 기준선(7일 평균의 지수이동평균)을 상태 파일에 보관하고
+    #   새 stdDay만 반영하여 갱신 (전체 이력을 다시 계산하지 않음)
+    # - 기준선 대비 증가율 = 7일 평균 / 직전 기준선 - 1
+    RULES = ('avg7_above', 'growth_above')
+
+    def __init__(self, config, store):
+        self.store = store
+        alert = config['ALERT'] if config.has_section('ALERT') else {}
+        baseline_days = int(alert.get('baseline_days', 28))
+        self.alpha = 2 / (baseline_days + 1)
+        self.warmup_days = baseline_days + 6
+        self.growth_min_avg7 = float(alert.get('growth_min_avg7', 10))
+        self.state_file = os.path.join(config.get('FILES', 'dir_download'),
+                                       alert.get('state_file', 'Alerts.json'))
+        self.rules = {}
+        for section in config.sections():
+            if section.startswith('ALERT:'):
+                self.rules[section.split(':', 1)[1]] = {
+                    rule: config.getfloat(section, rule) for rule in self.RULES
+                    if config.has_option(section, rule)}
+        self.state = self.load()
+
+    def load(self):
+        if not os.path.isfile(self.state_file):
+            return {'stats': {}, 'rules': {}}
+        with open(self.state_file, encoding='utf-8') as file:
+            return json.load(file)
+
+    def save(self):
+        temp_file = self.state_file + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as file:
+            json.dump(self.state, file, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(temp_file, self.state_file)
+
+    def update(self, end_date=None):
+        # 시도별 마지막 반영일 이후의 레코드만 조회하여 통계 갱신 (처음에는 warmup_days 만큼)
+        if not self.rules:
+            return 0  # 규칙이 없으면 조회하지 않음 (빈 목록은 전체 시도 조회)
+        end_date = end_date or date.today()
+        stats = self.state['stats']
+        last_days = [date.fromisoformat(stats[region]['last_day'])
+                     for region in self.rules if region in stats]
+        if len(last_days) == len(self.rules) and last_days:
+            start_date = min(last_days) + timedelta(days=1)
+        else:
+            start_date = end_date - timedelta(days=self.warmup_days)
+        if start_date > end_date:
+            return 0
+
+        records = self.store.query(start_date, end_date, list(self.rules))
+        updated = 0
+        for record in records:
+            if record.inc_dec is not None and self.add(record):
+                updated += 1
+        return updated
+
+    def add(self, record):
+        stat = self.state['stats'].setdefault(record.gubun_en, {
+            'last_day': None, 'window': [], 'avg7': None, 'baseline': None, 'prev_baseline': None})
+        std_day = record.std_day.isoformat()
+        if stat['last_day'] is not None and std_day <= stat['last_day']:
+            return False
+        # 최근 7일(발표가 없는 날짜 제외) 값 유지
+        first_day = (record.std_day - timedelta(days=6)).isoformat()
+        stat['window'] = [item for item in stat['window'] if item[0] >= first_day]
+        stat['window'].append([std_day, record.inc_dec])
+        stat['avg7'] = sum(item[1] for item in stat['window']) / len(stat['window'])
+        stat['prev_baseline'] = stat['baseline']
+        if stat['baseline'] is None:
+            stat['baseline'] = stat['avg7']
         else:
-            plt.rcParams['font.family'] = 'AppleGothic'  # Mac OS
-        plt.rcParams['axes.unicode_minus'] = False  # (-) 부호 깨짐 현상 방지
+            stat['baseline'] += self.alpha * (stat['avg7'] - stat['baseline'])
+        stat['last_day'] = std_day
+        return True
+
+    def evaluate(self):
+        # 반환값: 상태가 바뀐 규칙 목록 (gubunEn, 규칙, 경보 여부, 값)
+        changes = []
+        for region, rules in self.rules.items():
+            stat = self.state['stats'].get(region)
+            if stat is None or stat['avg7'] is None:
+                continue
+            growth = None
+            if stat['prev_baseline'] and stat['avg7'] >= self.growth_min_avg7:
+                growth = stat['avg7'] / stat['prev_baseline'] - 1
+            for rule, threshold in rules.items():
+                value = stat['avg7'] if rule == 'avg7_above' else growth
+                active = value is not None and value > threshold
+                key = region + ':' + rule
+                previous = self.state['rules'].get(key, {}).get('active', False)
+                if active != previous:
+                    changes.append({'region': region, 'rule': rule, 'active': active,
+                                    'value': stat['avg7'], 'growth': growth,
+                                    'threshold': threshold, 'std_day': stat['last_day']})
+        return changes
+
+    def commit(self, changes):
+        # 전송 후 규칙 상태 저장 (전송 실패 시 다음 실행에서 다시 감지)
+        for change in changes:
+            self.state['rules'][change['region'] + ':' + change['rule']] = {
+                'active': change['active'], 'since': change['std_day']}
+        self.save()
+
+
+class FontResolver:
+    # 한글 폰트 탐색 결과를 파일에 저장하여 재사용 (폰트 파일 mtime이 바뀌면 다시 탐색)
+    CANDIDATES = ('Malgun Gothic', 'NanumGothic', 'AppleGothic')  # Windows, Linux, Mac OS
+
+    def __init__(self, config):
+        self.font_path = config.get('CHART', 'font_path', fallback='')
+        self.font_family = config.get('CHART', 'font_family', fallback='')
+        self.cache_file = config.get('CHART', 'font_cache_file', fallback='font_cache.json')
+
+    def resolve(self):
+        import matplotlib.font_manager as fm
+
+        # 1. config.ini에 폰트 파일 또는 폰트명을 직접 지정한 경우
+        if self.font_path:
+            fm.fontManager.addfont(self.font_path)
+            return fm.FontProperties(fname=self.font_path).get_name()
+        if self.font_family:
+            return self.font_family
+
+        # 2. 캐시된 탐색 결과
+        cached = self.load_cache()
+        if cached:
+            return cached['family']
+
+        # 3. 전체 폰트 목록 탐색 후 저장
+        fonts = {}
+        for font in fm.fontManager.ttflist:
+            fonts.setdefault(font.name, font.fname)
+        for family in self.CANDIDATES:
+            if family in fonts:
+                self.save_cache(family, fonts[family])
+                return family
+        return self.CANDIDATES[-1]
+
+    def load_cache(self):
+        if not os.path.isfile(self.cache_file):
+            return None
+        try:
+            with open(self.cache_file, encoding='utf-8') as file:
+                cached = json.load(file)
+            if os.path.getmtime(cached['path']) == cached['mtime']:
+                return cached
+        except (OSError, ValueError, KeyError) as error:
+            print(f"Font cache is invalid: {error}")
+        return None
+
+    def save_cache(self, family, path):
+        with open(self.cache_file, 'w', encoding='utf-8') as file:
+            json.dump({'family': family, 'path': path, 'mtime': os.path.getmtime(path)},
+                      file, ensure_ascii=False, indent=2)
+        print(f"Font cache saved successfully. : {self.cache_file}")
+
+
+class ChartSeries(CommonFunc):
+    # QuickChart 차트 데이터 구성
+    # - max_points보다 긴 기간은 LTTB(Largest-Triangle-Three-Buckets)로 줄이고 최댓값은 항상 유지
+    # - 짧은 날짜 라벨(MM-DD, 연도가 바뀌면 YY-MM-DD), 공백 없는 JSON
+    # - URL이 max_url_length를 넘으면 POST /chart/create로 짧은 URL을 발급 (같은 차트는 재사용)
+    def __init__(self, config):
+        self.quickchart_url = config.get('CHART', 'quickchart_url',
+                                         fallback='https://quickchart.io').rstrip('/')
+        self.max_points = config.getint('CHART', 'max_points', fallback=60)
+        self.max_url_length = config.getint('CHART', 'max_url_length', fallback=2000)
+        self.http = HttpClient(config, 'CHART')
+        self.lock = threading.Lock()
+        self.short_urls = {}  # 차트 JSON 해시 -> 짧은 URL
+
+    @staticmethod
+    def lttb(values, threshold):
+        # 반환값: 남길 인덱스 목록 (첫 점, 마지막 점 포함)
+        length = len(values)
+        if threshold >= length or threshold < 3:
+            return list(range(length))
+        every = (length - 2) / (threshold - 2)
+        selected = [0]
+        a = 0
+        for i in range(threshold - 2):
+            # 다음 구간의 평균점
+            avg_start = int((i + 1) * every) + 1
+            avg_end = min(int((i + 2) * every) + 1, length)
+            avg_x = (avg_start + avg_end - 1) / 2
+            avg_y = sum(values[avg_start:avg_end]) / (avg_end - avg_start)
+            # 현재 구간에서 직전 선택점, 다음 구간 평균점과 만드는 삼각형 넓이가 가장 큰 점
+            range_start = int(i * every) + 1
+            range_end = int((i + 1) * every) + 1
+            max_area = -1
+            for j in range(range_start, range_end):
+                area = abs((a - avg_x) * (values[j] - values[a]) - (a - j) * (avg_y - values[a]))
+                if area > max_area:
+                    max_area = area
+                    next_a = j
+            selected.append(next_a)
+            a = next_a
+        selected.append(length - 1)
+        peak = max(range(length), key=values.__getitem__)
+        if peak not in selected:
+            selected = sorted(selected + [peak])
+        return selected
+
+    def short_labels(self, labels):
+        days = [datetime.strptime(label, '%Y-%m-%d') for label in labels]
+        fmt = '%m-%d' if len({day.year for day in days}) <= 1 else '%y-%m-%d'
+        return [day.strftime(fmt) for day in days]
+
+    def downsample(self, labels, values):
+        values = [int(value) for value in values]
+        selected = self.lttb(values, self.max_points)
+        if len(selected) < len(values):
+            METRICS.inc('chart_points_dropped', len(values) - len(selected))
+        return self.short_labels([labels[i] for i in selected]), [values[i] for i in selected]
+
+    def dumps(self, chart):
+        return json.dumps(chart, ensure_ascii=False, separators=(',', ':'))
+
+    def get_url(self, chart):
+        chart_json = self.dumps(chart)
+        chart_url = self.quickchart_url + '/chart?bkg=%23ffffff&c=' + parse.quote(chart_json, safe='')
+        if len(chart_url) <= self.max_url_length:
+            return chart_url
+        return self.create_short_url(chart, chart_json) or chart_url
+
+    def parse_create(self, status, response_body):
+        if status != 200:
+            print(f"QuickChart create failed: HTTP {status}")
+            return None
+        response = json.loads(response_body)
+        return response.get('url') if response.get('success') else None
+
+    def create_short_url(self, chart, chart_json):
+        # 반환값: 짧은 URL (실패 시 None → GET URL 그대로 사용)
+        from http import client
+
+        chart_hash = hashlib.sha256(chart_json.encode('utf-8')).hexdigest()
+        with self.lock:
+            if chart_hash in self.short_urls:
+                METRICS.inc('cache_hits', cache='chart_url')
+                return self.short_urls[chart_hash]
+        METRICS.inc('cache_misses', cache='chart_url')
+        body = self.dumps({'backgroundColor': '#ffffff', 'chart': chart}).encode('utf-8')
+        try:
+            chart_url = self.http.post(self.quickchart_url + '/chart/create', body,
+                                       {'Content-Type': 'application/json'}, self.parse_create)
+        except (RetryLater, CircuitOpen, OSError, client.HTTPException, ValueError) as error:
+            print(f"QuickChart create failed: {error}")
+            return None
+        if chart_url:
+            with self.lock:
+                self.short_urls[chart_hash] = chart_url
+        return chart_url
+
+
+# 차트 1개 = 데이터(labels, values) + 파일별 문구 {파일명 접미사(언어 등): ChartCaption}
+ChartCaption = namedtuple('ChartCaption', ['title', 'subtitle', 'xlabel', 'ylabel', 'legend'])
+ChartJob = namedtuple('ChartJob', ['labels', 'values', 'captions'])
+
+
+class ChartRenderer:
+    # matplotlib Figure 객체로 차트를 그려서 저장 (pyplot 전역 상태를 쓰지 않으므로 프로세스/스레드별로 독립)
+    # 렌더링 프로세스에서 이름으로 찾아 호출하므로 정적 메서드로만 구성
+    @staticmethod
+    def init_worker(font_family, font_path=''):
+        # 워커 시작 시 1회: 폰트 등록/탐색, 글자 렌더링까지 미리 해 두어 첫 차트가 느려지지 않도록 함
+        import matplotlib
+        import matplotlib.font_manager as fm
+        from matplotlib.figure import Figure
+
+        if font_path:
+            fm.fontManager.addfont(font_path)
+        # matplotlib 한글깨짐 방지
+        matplotlib.rcParams['font.family'] = font_family
+        matplotlib.rcParams['axes.unicode_minus'] = False  # (-) 부호 깨짐 현상 방지
+        fm.findfont(fm.FontProperties(family=font_family))
+        fig = Figure(figsize=(1, 1))
+        try:
+            fig.text(0, 0, '1,234 가나다')
+            fig.savefig(io.BytesIO(), format='png', dpi=10)
+        finally:
+            fig.clear()
+        return os.getpid()
+
+    @staticmethod
+    def render(job, outputs):
+        # outputs: [(파일 경로, ChartCaption)] -> 저장한 파일 경로 목록
+        # 그래프는 한 번만 그리고, 파일마다 제목/축 이름/범례 문구만 바꿔서 저장
+        from matplotlib.figure import Figure
+
+        idx_list = list(range(len(job.labels)))
+        fig = Figure(figsize=(10, 6))  # 그래프 크기 지정
+        try:
+            ax = fig.add_subplot()
+
+            # 꺾은 선 그래프 생성
+            line, = ax.plot(idx_list, job.values,
+                            linewidth=3, color='hotpink',  # 선 스타일 지정
+                            # 표식 추가, 표식 스타일 지정
+                            marker='o', markersize=6, markeredgecolor='hotpink', markerfacecolor='white')
+
+            # x축 설정
+            ax.set_xticks(idx_list, labels=job.labels,
+                          rotation=35)  # rotation:각도
+
+            # 그래프 값 표시
+            for i, height in enumerate(job.values):
+                ax.text(idx_list[i], height, format(height, ','),
+                        ha='center', va='bottom', size=11, color='black')
+
+            saved = []
+            for file_path, caption in outputs:
+                fig.suptitle(caption.title, fontsize=16, color='black')
+                ax.set_title(caption.subtitle, loc='right', fontsize=12, color='gray')
+                ax.set_xlabel(caption.xlabel, fontsize=13)
+                ax.set_ylabel(caption.ylabel, fontsize=13)
+                line.set_label(caption.legend)
+                ax.legend(loc='best')  # 범례 표시 및 위치 지정
+
+                # 임시 파일에 저장 후 교체 (중단되어도 같은 이름의 불완전한 파일이 남지 않음)
+                tmp_path = file_path + '.tmp'
+                fig.savefig(tmp_path, format='png', dpi=100)
+                os.replace(tmp_path, file_path)
+                saved.append(file_path)
+        finally:
+            fig.clear()  # Axes, Artist 해제
+        return saved
+
+
+class ChartPool:
+    # 차트 렌더링 프로세스 풀 (폰트를 불러 둔 워커를 프로세스 종료 시까지 유지, 데몬에서는 실행 간 재사용)
+    # - render_workers: 0이면 CPU 수, 1이면 현재 프로세스에서 렌더링
+    # - 작업 단위는 차트 1개 (언어별 파일은 같은 워커에서 문구만 바꿔 저장)
+    # - 차트가 1개뿐이면 프로세스 간 전달 비용이 더 크므로 현재 프로세스에서 렌더링
+    executors = {}    # (워커 수, 폰트) -> ProcessPoolExecutor
+    local_fonts = set()  # 현재 프로세스에 적용한 폰트
+    lock = threading.Lock()
+
+    def __init__(self, config, font_family, font_path=''):
+        workers = config.getint('CHART', 'render_workers', fallback=0)
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.font = (font_family, font_path)
+
+    def get_executor(self):
+        from concurrent.futures import ProcessPoolExecutor
+
+        key = (self.workers,) + self.font
+        with ChartPool.lock:
+            if key not in ChartPool.executors:
+                ChartPool.executors[key] = ProcessPoolExecutor(
+                    max_workers=self.workers, initializer=ChartRenderer.init_worker, initargs=self.font)
+            return ChartPool.executors[key]
+
+    def discard(self):
+        key = (self.workers,) + self.font
+        with ChartPool.lock:
+            executor = ChartPool.executors.pop(key, None)
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def warm(self, charts=None):
+        # render()가 사용할 곳에 폰트를 불러 둠 (준비한 프로세스의 PID 목록 반환)
+        # charts: 한 번에 렌더링할 차트 수, 1개면 현재 프로세스에서 그리므로 워커를 띄우지 않음
+        if self.workers <= 1 or charts == 1:
+            self.init_local()
+            return [os.getpid()]
+        executor = self.get_executor()
+        futures = [executor.submit(os.getpid) for _ in range(self.workers)]
+        return sorted({future.result() for future in futures})
+
+    def init_local(self):
+        with ChartPool.lock:
+            if self.font not in ChartPool.local_fonts:
+                ChartRenderer.init_worker(*self.font)
+                ChartPool.local_fonts.add(self.font)
+
+    def render_local(self, jobs):
+        self.init_local()
+        return [file_path for job, outputs in jobs for file_path in ChartRenderer.render(job, outputs)]
+
+    def render(self, jobs):
+        # jobs: [(ChartJob, [(파일 경로, ChartCaption)])] -> 저장한 파일 경로 목록
+        import pickle
+        from concurrent.futures.process import BrokenProcessPool
+
+        if self.workers <= 1 or len(jobs) <= 1:
+            return self.render_local(jobs)
+        try:
+            executor = self.get_executor()
+            futures = [executor.submit(ChartRenderer.render, job, outputs) for job, outputs in jobs]
+            return [file_path for future in futures for file_path in future.result()]
+        except (BrokenProcessPool, pickle.PicklingError) as error:
+            print(f"Chart render pool is unavailable, rendering in process. : {error}")
+            self.discard()
+            return self.render_local(jobs)
+
 
+class ChartAPI(CommonFunc):
+    def __init__(self, config):
+        font = FontResolver(config)
+        self.pool = ChartPool(config, font.resolve(), font.font_path)
         self.dir_chart = config.get('FILES', 'dir_chart')
         self.chart_name = config.get('FILES', 'chart_name')
-        self.today = self.get_formatted_datetime(date.today(), 5)
-        self.chart_dt = self.get_formatted_datetime(datetime.today(), 4)
 
-    def create_chart(self, total_stdday_list, total_incdec_list):
-        idx_list = list(range(len(total_stdday_list)))
-        inc_dec = list(map(int, total_incdec_list))
+    def set_chart_path(self, job, caption, suffix):
+        # 데이터와 차트 문구가 같으면 같은 파일명 (이미 있으면 다시 그리지 않음)
+        source = json.dumps([job.labels, job.values, caption], ensure_ascii=False)
+        chart_hash = hashlib.sha256(source.encode('utf-8')).hexdigest()[:16]
+        file_name = self.chart_name + '_' + chart_hash + '_' + suffix + '.png'
+        return os.path.join(self.dir_chart, file_name)
 
-        plt.figure(figsize=(10, 6))  # 그래프 크기 지정
-        plt.suptitle('한국 코로나19 감염 추이', fontsize=16, color='black')
-        plt.title('기준일자 : ' + self.today, loc='right',
-                fontsize=12, color='gray')
-        plt.xlabel('기준일자', fontsize=13)
-        plt.ylabel('확진자수(명)', fontsize=13)
+    def create_charts(self, total_stdday_list, total_incdec_list, texts):
+        inc_dec = list(map(int, total_incdec_list))
+        std_day = total_stdday_list[-1] if total_stdday_list else ''
+        # 언어별 차트는 데이터가 같으므로 차트 1개로 그리고 언어별 문구만 바꿔 저장
+        return self.render_charts([ChartJob(labels=list(total_stdday_list), values=inc_dec, captions={
+            lang: ChartCaption(title=text.get('plot_title'), subtitle=text.get('plot_xlabel') + ' : ' + std_day,
+                               xlabel=text.get('plot_xlabel'), ylabel=text.get('plot_ylabel'),
+                               legend=text.get('plot_data_one'))
+            for lang, text in texts.items()})])
+
+    def render_charts(self, jobs):
+        # jobs: [ChartJob] -> {파일명 접미사: 파일 경로}
+        # 같은 내용(해시)의 파일이 이미 있으면 건너뛰고, 나머지는 차트별로 렌더링 풀에서 병렬 생성
+        chart_files = {}
+        pending = []
+        for job in jobs:
+            outputs = []
+            for suffix, caption in job.captions.items():
+                chart_files[suffix] = self.set_chart_path(job, caption, suffix)
+                if os.path.isfile(chart_files[suffix]):
+                    print('Chart file exists. : ' + chart_files[suffix])
+                    METRICS.inc('cache_hits', cache='chart')
+                else:
+                    METRICS.inc('cache_misses', cache='chart')
+                    outputs.append((chart_files[suffix], caption))
+            if outputs:
+                pending.append((job, outputs))
+        if not pending:
+            return chart_files
+
+        os.makedirs(self.dir_chart, exist_ok=True)
+        start_time = time.perf_counter()
+        with METRICS.span('chart_render'):
+            saved = self.pool.render(pending)
+        for file_path in saved:
+            print('Chart file saved successfully. : ' + file_path)
+        elapsed = time.perf_counter() - start_time
+        METRICS.inc('charts_rendered', len(saved))
+        print(f"Chart rendering : {len(saved)} files from {len(pending)} charts in {elapsed:.2f}s "
+              f"({len(saved) / elapsed:.1f} files/s, workers={min(self.pool.workers, len(pending))}, "
+              f"skipped={len(chart_files) - len(saved)})")
+        return chart_files
 
-        # 꺾은 선 그래프 생성
-        plt.plot(idx_list, inc_dec,
-                linewidth=3, color='hotpink', label='확진자 수 추이',  # 선 스타일 지정, 범례 추가
-                # 표식 추가, 표식 스타일 지정
-                marker='o', markersize=6, markeredgecolor='hotpink', markerfacecolor='white')
 
-        # 범례 표시 및 위치 지정
-        plt.legend(loc='best')
+class I18nAPI:
+    # 언어별 문구는 Locale/<언어>.json에서 읽음 (파일 추가만으로 언어 추가)
+    # 디렉터리별로 프로세스당 1회 로드, 이후에는 수정 시각이 바뀐 파일만 다시 읽음
+    DIR_LOCALE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Locale')
+    catalogs = {}  # 디렉터리 -> {언어: 문구}
+    mtimes = {}    # 디렉터리 -> {언어: 파일 수정 시각}
+    lock = threading.Lock()
+
+    def __init__(self, dir_locale=None):
+        self.i18n = self.load_catalogs(dir_locale or self.DIR_LOCALE)
+
+    @classmethod
+    def load_catalogs(cls, dir_locale):
+        with cls.lock:
+            files = {file_name[:-len('.json')]: os.path.join(dir_locale, file_name)
+                     for file_name in sorted(os.listdir(dir_locale)) if file_name.endswith('.json')}
+            mtimes = {lang: os.path.getmtime(file_path) for lang, file_path in files.items()}
+            if cls.mtimes.get(dir_locale) != mtimes:
+                loaded = cls.catalogs.get(dir_locale, {})
+                catalogs = {}
+                for lang, file_path in files.items():
+                    if lang in loaded and cls.mtimes[dir_locale].get(lang) == mtimes[lang]:
+                        catalogs[lang] = loaded[lang]
+                    else:
+                        with open(file_path, encoding='utf-8') as file:
+                            catalogs[lang] = json.load(file)
+                cls.catalogs[dir_locale] = catalogs
+                cls.mtimes[dir_locale] = mtimes
+            return cls.catalogs[dir_locale]
+
+    @classmethod
+    def get_mtime(cls, lang, dir_locale=None):
+        # 불러온 문구 파일의 수정 시각 (메시지 구조 캐시 키)
+        return cls.mtimes.get(dir_locale or cls.DIR_LOCALE, {}).get(lang)
 
-        # x축 설정
-        plt.xticks(idx_list, labels=total_stdday_list,
-                   rotation=35)  # rotation:각도
+    def set_i18n(self, lang):
+        lang = self.i18n.get(lang)
+        return lang
 
-        # 그래프 값 표시
-        for i, height in enumerate(inc_dec):
-            plt.text(idx_list[i], height, format(height, ','),
-                     ha='center', va='bottom', size=11, color='black')
 
-        file_name = self.chart_name + '_' + self.chart_dt + '.png'
-        file_path = os.path.join(self.dir_chart, file_name)
-        plt.savefig(file_path, dpi=100)
-        # plt.show()
+# 메시지 구조의 값 자리 (prefix: 값 앞에 붙는 고정 문구), 목록에 펼쳐 넣을 자리
+MessageSlot = namedtuple('MessageSlot', ['name', 'prefix'], defaults=[''])
+MessageSplice = namedtuple('MessageSplice', ['name'])
 
-        return file_path
 
+class MessageTemplate:
+    # 언어별 메시지 구조(Block Kit, attachments)를 한 번만 만들고 전송마다 값 자리만 채움
+    # - 값 자리가 없는 부분(고정 문구 블록 등)은 복사하지 않고 그대로 사용
+    # - 값이 없으면 MISSING으로 표시
+    MISSING = '-'
 
-class I18nAPI:
-    def __init__(self):
-        self.i18n = {
-            "en": {
-                "notification": "Today''s COVID-19 Notification in S.Korea",
-                "title": "COVID-19 Statistics",
-                "block_section_one_title": ":one: New Cases (Subtotal) : ",
-                "block_section_two_title": ":two: Daily Trend",
-                "attach_one_title": ":one: Daily New Cases",
-                "attach_one_field_one": "Subtotal (A+B)",
-                "attach_one_field_two": "Domestic (A)",
-                "attach_one_field_three": "Inflow (B)",
-                "attach_one_field_four": "Incheon",
-                "attach_one_footer": "<http://ncov.kdca.go.kr/en/|KDCA(English)>",
-                "attach_two_title": ":two: Chart",
-                "attach_two_field_one": "Confirmed",
-                "attach_two_field_two": "Death",
-                "attach_two_footer": "<http://ncov.kdca.go.kr/en/|KDCA(English)>",
-                "plot_title": "Daily Trend of COVID-19, Republic of Korea",
-                "plot_data_one": "Confirmed",
-                "plot_xlabel": "Date",
-                "plot_ylabel": "Cases"
-            },
-            "ko": {
-                "notification": "오늘의 코로나19 알림",
-                "title": "코로나19 통계정보",
-                "block_section_one_title": ":one: 추가확진 (소계) : ",
-                "block_section_two_title": ":two: 일자별 추이",
-                "attach_one_title": ":one: 추가확진",
-                "attach_one_field_one": "소계 (A+B)",
-                "attach_one_field_two": "국내 (A)",
-                "attach_one_field_three": "해외유입 (B)",
-                "attach_one_field_four": "인천",
-                "attach_one_footer": "<http://ncov.kdca.go.kr/|KDCA(Korean)>",
-                "attach_two_title": ":two: 차트",
-                "attach_two_field_one": "누적확진",
-                "attach_two_field_two": "사망",
-                "attach_two_footer": "<http://ncov.kdca.go.kr/|KDCA(Korean)>",
-                "plot_title": "한국의 코로나19 감염 추이",
-                "plot_data_one": "확진",
-                "plot_xlabel": "일자",
-                "plot_ylabel": "건수"
-            },
-            "ja": {
-                "notification": "本日のコロナ19のお知らせ(韓国)",
-                "title": "コロナ19の統計情報",
-                "block_section_one_title": ":one: 追加確診 (小計) : ",
-                "block_section_two_title": ":two: 日付別推移",
-                "attach_one_title": ":one: 追加確診",
-                "attach_one_field_one": "小計 (A+B)",
-                "attach_one_field_two": "韓国国内 (A)",
-                "attach_one_field_three": "海外流入 (B)",
-                "attach_one_field_four": "仁川",
-                "attach_one_footer": "<http://ncov.kdca.go.kr/en/|KDCA(English)>",
-                "attach_two_title": ":two: チャート",
-                "attach_two_field_one": "累積確診",
-                "attach_two_field_two": "死亡",
-                "attach_two_footer": "<http://ncov.kdca.go.kr/en/|KDCA(English)>",
-                "plot_title": "韓国のコロナ19感染推移",
-                "plot_data_one": "確診",
-                "plot_xlabel": "日付",
-                "plot_ylabel": "件数"
-            }
-        }
+    def __init__(self, skeleton):
+        self.skeleton = skeleton
+        self.dynamic = set()  # 값 자리를 포함한 dict/list의 id (skeleton이 보유하므로 유효)
+        self.find_slots(skeleton)
 
-    def set_i18n(self, lang):
-        lang = self.i18n.get(lang)
-        return lang
+    def find_slots(self, node):
+        if isinstance(node, (MessageSlot, MessageSplice)):
+            return True
+        if isinstance(node, dict):
+            children = list(node.values())
+        elif isinstance(node, list):
+            children = node
+        else:
+            return False
+        found = [self.find_slots(child) for child in children]
+        if any(found):
+            self.dynamic.add(id(node))
+        return any(found)
+
+    def fill(self, values):
+        return self.substitute(self.skeleton, values)
+
+    def substitute(self, node, values):
+        if isinstance(node, MessageSlot):
+            value = values.get(node.name)
+            if value is None:
+                value = self.MISSING
+            return node.prefix + str(value) if node.prefix else value
+        if id(node) not in self.dynamic:
+            return node
+        if isinstance(node, dict):
+            return {key: self.substitute(value, values) for key, value in node.items()}
+        if isinstance(node, list):
+            items = []
+            for item in node:
+                if isinstance(item, MessageSplice):
+                    items.extend(values.get(item.name) or ())
+                else:
+                    items.append(self.substitute(item, values))
+            return items
+        return node
 
 
 class SlackAPI(CommonFunc):
     def __init__(self, sys_info, config):
+        from slack_sdk import WebClient
+
         token = config.get('SLACK', 'bot_token')
-        # 슬랙 클라이언트 인스턴스 생성
-        self.client = WebClient(token)
+        # Slack Web API 주소 (벤치마크 시 로컬 대체 서버 지정)
+        self.api_url = config.get('SLACK', 'api_url', fallback='https://slack.com/api/')
+        # 슬랙 클라이언트 인스턴스 생성 (토큰별 1개)
+        self.client = WebClient(token, base_url=self.api_url)
+        self.token = token
+        self.clients = {token: self.client}
         self.channel_id = config.get('SLACK', 'channel_id')
         self.hostname = sys_info.system_info()
         self.datetime = self.get_formatted_datetime(date.today(), 2)
@@ -412,38 +1944,122 @@ class SlackAPI(CommonFunc):
         }
         self.chart_labels = []
         self.chart_data = []
+        self.renderer = config.get('CHART', 'renderer', fallback='quickchart')
+        self.series = ChartSeries(config)
+        self.upload_file = os.path.join(config.get('FILES', 'dir_chart'), 'Uploaded.json')
+        self.charts = {}  # 언어 -> 업로드한 차트 파일 ID
+        self.templates = {}  # (언어, 문구 파일 수정 시각) -> MessageTemplate
+        self.attachments = {}  # (언어, 문구, 차트 파일 ID) -> 시도/차트 값 (set_payload 시 초기화)
+
+    def get_client(self, token):
+        from slack_sdk import WebClient
+
+        if token not in self.clients:
+            self.clients[token] = WebClient(token, base_url=self.api_url)
+        return self.clients[token]
 
     def set_payload(self, total_stdday_list, total_incdec_list, cnt_data):
+        self.datetime = self.get_formatted_datetime(date.today(), 2)
         self.payload.update(cnt_data)
         self.chart_labels = total_stdday_list
         self.chart_data = total_incdec_list
+        self.attachments.clear()
+
+    def upload_charts(self, chart_files, token=None):
+        # 같은 차트 파일은 워크스페이스별로 한 번만 업로드 (토큰 해시 -> 파일명 -> 파일 ID를 dir_chart에 기록)
+        # 업로드에 실패한 언어는 반환값에서 빠지므로 메시지에는 QuickChart 차트를 첨부
+        from slack_sdk.errors import SlackApiError, SlackClientError
+
+        token = token or self.token
+        client = self.get_client(token)
+        token_key = hashlib.sha256(token.encode('utf-8')).hexdigest()[:12]
+        uploads = {}
+        if os.path.isfile(self.upload_file):
+            with open(self.upload_file, encoding='utf-8') as file:
+                uploads = json.load(file)
+        uploaded = uploads.setdefault(token_key, {})
+
+        charts = {}
+        for lang, file_path in chart_files.items():
+            file_name = os.path.basename(file_path)
+            METRICS.inc('cache_misses' if file_name not in uploaded else 'cache_hits',
+                        cache='chart_upload')
+            if file_name not in uploaded:
+                try:
+                    with METRICS.span('http', target='slack', method='files.upload'):
+                        response = client.files_upload_v2(
+                            file=file_path, filename=file_name, title=file_name)
+                    uploaded[file_name] = response['file']['id']
+                    print(f"Chart file uploaded successfully. : {file_name}")
+                except SlackApiError as error:
+                    print(f"Slack API 오류 발생: {error.response['error']}")
+                    continue
+                except (SlackClientError, OSError, ValueError) as error:
+                    # 업로드 URL로 파일 전송 단계 오류 (URLError, 잘못된 URL 등)
+                    print(f"Chart file upload failed, use QuickChart instead. : {file_name} ({error})")
+                    continue
+            charts[lang] = uploaded[file_name]
+
+        with open(self.upload_file, 'w', encoding='utf-8') as file:
+            json.dump(uploads, file, indent=2)
+        if token == self.token:
+            self.charts = charts
+        return charts
+
+    def set_chart_attachment(self, text, lang, charts=None):
+        charts = self.charts if charts is None else charts
+        if lang in charts:
+            # 로컬에서 생성하여 업로드한 차트
+            return {
+                "color": "#dddddd",
+                "blocks": [
+                    {
+                        "type": "section",
+                        "text": {
+                            "type": "mrkdwn",
+                            "text": text.get('attach_two_title')
+                        }
+                    },
+                    {
+                        "type": "image",
+                        "slack_file": {"id": charts[lang]},
+                        "alt_text": text.get('plot_title')
+                    }
+                ]
+            }
+        return {
+            "color": "#dddddd",
+            "title": text.get('attach_two_title'),
+            "image_url": self.set_chart_url(text)
+        }
 
-    def post_message(self, text):
+    def set_chart_url(self, text):
+        labels, data = self.series.downsample(self.chart_labels, self.chart_data)
         chart = {
             "type": "bar",
             "data": {
-                "labels": self.chart_labels,
+                "labels": labels,
                 "datasets": [
                     {
                         "type": "line",
                         "label": text.get('plot_data_one'),
-                        "borderColor": "rgb(255, 99, 132)",
-                        "backgroundColor": "rgba(255, 99, 132, 0.5)",
-                        "fill": "false",
-                        "data": self.chart_data
+                        "borderColor": "rgb(255,99,132)",
+                        "backgroundColor": "rgba(255,99,132,0.5)",
+                        "fill": False,
+                        "data": data
                     }
                 ]
             },
             "options": {
                 "title": {
-                    "display": "true",
+                    "display": True,
                     "text": text.get('plot_title'),
                 },
                 "scales": {
                     "xAxes": [
                         {
                             "scaleLabel": {
-                                "display": "true",
+                                "display": True,
                                 "labelString": text.get('plot_xlabel')
                             }
                         }
@@ -451,10 +2067,10 @@ class SlackAPI(CommonFunc):
                     "yAxes": [
                         {
                             "ticks": {
-                                "beginAtZero": "true"
+                                "beginAtZero": True
                             },
                             "scaleLabel": {
-                                "display": "true",
+                                "display": True,
                                 "labelString": text.get('plot_ylabel')
                             }
                         }
@@ -462,99 +2078,993 @@ class SlackAPI(CommonFunc):
                 }
             }
         }
-        chart_url = 'https://quickchart.io/chart?bkg=%23ffffff&c='
-        chart_url += parse.urlencode({'data': json.dumps(chart)})
-
-        try:
-            self.client.chat_postMessage(
-                channel=self.channel_id,
-                text=text.get('notification'),
-                blocks=[
-                    {
-                        "type": "header",
-                        "text": {
+        return self.series.get_url(chart)
+
+    def set_region_fields(self, text):
+        regions = self.payload.get('regions')
+        if regions is None:
+            return [{
+                "short": True,
+                "title": text.get('attach_one_field_four'),
+                "value": self.payload.get('Incheon')
+            }]
+        return [{
+            "short": True,
+            "title": text.get('regions', {}).get(region['gubun_en'], region['gubun']),
+            "value": self.format_region(text, region)
+        } for region in regions]
+
+    def format_region(self, text, region):
+        def number(value, fmt):
+            return '-' if value is None else format(value, fmt)
+
+        return (number(region['inc_dec'], ',.0f') + '\n'
+                + text.get('region_avg7') + ' ' + number(region['avg7'], ',.0f') + ' · '
+                + text.get('region_wow') + ' ' + number(region['wow'], '+.1%') + ' · '
+                + text.get('region_rate') + ' ' + number(region['per_100k'], '.2f'))
+
+    def get_template(self, text, lang):
+        key = (lang, I18nAPI.get_mtime(lang))
+        if key not in self.templates:
+            self.templates[key] = MessageTemplate(self.set_skeleton(text))
+        return self.templates[key]
+
+    def get_attachments(self, text, lang, charts=None):
+        # 시도 필드와 차트는 같은 데이터, 같은 언어면 결과가 같으므로 대상별로 다시 만들지 않음
+        charts = self.charts if charts is None else charts
+        key = (lang, I18nAPI.get_mtime(lang), charts.get(lang))
+        if key not in self.attachments:
+            self.attachments[key] = {
+                'region_fields': self.set_region_fields(text),
+                'chart': self.set_chart_attachment(text, lang, charts),
+            }
+        return self.attachments[key]
+
+    def build_message(self, text, lang, charts=None):
+        # 언어별로 미리 만든 구조에 값만 채움 (lang: 구조 캐시 키이므로 필수)
+        return self.get_template(text, lang).fill(dict(
+            self.payload,
+            channel_id=self.channel_id,
+            context=self.hostname + ", " + self.datetime,
+            **self.get_attachments(text, lang, charts)))
+
+    def set_skeleton(self, text):
+        # 언어별 메시지 구조 (값 자리: MessageSlot, 시도 필드: MessageSplice)
+        return {
+            "channel": MessageSlot('channel_id'),
+            "text": text.get('notification'),
+            "blocks": [
+                {
+                    "type": "header",
+                    "text": {
+                        "type": "plain_text",
+                        "text": text.get('title')
+                    }
+                },
+                {
+                    "type": "context",
+                    "elements": [
+                        {
                             "type": "plain_text",
-                            "text": text.get('title')
+                            "text": MessageSlot('context')
                         }
-                    },
-                    {
-                        "type": "context",
-                        "elements": [
-                            {
-                                "type": "plain_text",
-                                "text": self.hostname + ", " + self.datetime
-                            }
-                        ]
-                    },
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": text.get('block_section_one_title')
-                            + self.payload.get('전일대비확진자증감수')
-                        }
-                    },
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": text.get('block_section_two_title')
-                        }
-                    },
-                    {
-                        "type": "divider"
+                    ]
+                },
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": MessageSlot('전일대비확진자증감수', text.get('block_section_one_title'))
                     }
-                ],
-                attachments=[
-                    {
-                        "fields": [
-                            {
-                                "short": True,
-                                "title": text.get('attach_one_field_one'),
-                                "value": self.payload.get('전일대비확진자증감수')
-                            },
-                            {
-                                "short": True,
-                                "title": text.get('attach_one_field_two'),
-                                "value": self.payload.get('지역발생수')
-                            },
-                            {
-                                "short": True,
-                                "title": text.get('attach_one_field_three'),
-                                "value": self.payload.get('해외유입수')
-                            },
-                            {
-                                "short": True,
-                                "title": text.get('attach_one_field_four'),
-                                "value": self.payload.get('Incheon')
-                            },
-                            {
-                                "short": True,
-                                "title": text.get('attach_two_field_one'),
-                                "value": self.payload.get('누적확진자수')
-                            },
-                            {
-                                "short": True,
-                                "title": text.get('attach_two_field_two'),
-                                "value": self.payload.get('사망자수')
-                            }
-                        ],
-                        "title": text.get('attach_one_title'),
-                        "color": "#dddddd",
-                        "mrkdwn_in": ["title", "fields"],
-                        "footer_icon": self.payload.get('IconUrl'),
-                        "footer": text.get('attach_one_footer'),
-                        # "ts": create time 정보 없음
-                    },
-                    {
-                        "color": "#dddddd",
-                        "title": text.get('attach_two_title'),
-                        "image_url": chart_url
+                },
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": text.get('block_section_two_title')
                     }
-                ]
-            )
-        except SlackApiError as error:
-            print(f"Slack API 오류 발생: {error.response['error']}")
+                },
+                {
+                    "type": "divider"
+                }
+            ],
+            "attachments": [
+                {
+                    "fields": [
+                        {
+                            "short": True,
+                            "title": text.get('attach_one_field_one'),
+                            "value": MessageSlot('전일대비확진자증감수')
+                        },
+                        {
+                            "short": True,
+                            "title": text.get('attach_one_field_two'),
+                            "value": MessageSlot('지역발생수')
+                        },
+                        {
+                            "short": True,
+                            "title": text.get('attach_one_field_three'),
+                            "value": MessageSlot('해외유입수')
+                        },
+                        MessageSplice('region_fields'),
+                        {
+                            "short": True,
+                            "title": text.get('attach_two_field_one'),
+                            "value": MessageSlot('누적확진자수')
+                        },
+                        {
+                            "short": True,
+                            "title": text.get('attach_two_field_two'),
+                            "value": MessageSlot('사망자수')
+                        }
+                    ],
+                    "title": text.get('attach_one_title'),
+                    "color": "#dddddd",
+                    "mrkdwn_in": ["title", "fields"],
+                    "footer_icon": MessageSlot('IconUrl'),
+                    "footer": text.get('attach_one_footer'),
+                    # "ts": create time 정보 없음
+                },
+                MessageSlot('chart')
+            ]
+        }
+
+    def build_alert(self, text, changes):
+        # 경보/해제 한 줄씩, 알림 우선 표시를 위해 본문 첫 줄에 요약
+        lines = []
+        for change in changes:
+            region = text.get('regions', {}).get(change['region'], change['region'])
+            detail = text.get('alert_' + change['rule']).format(
+                **dict(change, growth=change['growth'] or 0.0))
+            lines.append(f"*{region}* : {detail}" if change['active']
+                         else f"{text.get('alert_cleared')} *{region}* : ~{detail}~")
+        return {
+            "channel": self.channel_id,
+            "text": text.get('alert_title') + ' ' + ' / '.join(lines),
+            "blocks": [
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": text.get('alert_title') + '\n' + '\n'.join(lines)
+                    }
+                },
+                {
+                    "type": "context",
+                    "elements": [
+                        {
+                            "type": "plain_text",
+                            "text": self.hostname + ", " + changes[-1]['std_day']
+                        }
+                    ]
+                }
+            ]
+        }
+
+
+class ChannelLimiter:
+    # 채널별 전송 간격 제한 (burst 만큼은 바로 전송, 이후 interval초마다 1건)
+    def __init__(self, burst, interval):
+        self.burst = burst
+        self.interval = interval
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if self.interval > 0:
+                    self.tokens = min(self.burst,
+                                      self.tokens + (now - self.updated) / self.interval)
+                else:
+                    self.tokens = self.burst
+                self.updated = now
+                if now >= self.blocked_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_time = max(self.blocked_until - now, (1 - self.tokens) * self.interval)
+            time.sleep(wait_time)
+
+    def block(self, seconds):
+        # ratelimited 응답의 Retry-After 동안 같은 채널 전송 중지
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+class SlackScheduler:
+    # 언어별 메시지를 채널 제한 내에서 동시에 전송하고 일시 오류는 백오프 후 재시도
+    TEMPORARY_ERRORS = ('ratelimited', 'internal_error', 'fatal_error',
+                        'service_unavailable', 'request_timeout')
+
+    def __init__(self, config):
+        config = config['SLACK']
+        self.max_workers = config.getint('max_workers', 3)
+        self.max_retries = config.getint('max_retries', 3)
+        self.retry_backoff = config.getfloat('retry_backoff', 1)
+        self.channel_burst = config.getint('channel_burst', 3)
+        self.channel_interval = config.getfloat('channel_interval', 1)
+        self.limiters = {}
+        self.lock = threading.Lock()
+
+    def get_limiter(self, client, channel):
+        key = (id(client), channel)  # 워크스페이스(클라이언트)별 채널
+        with self.lock:
+            if key not in self.limiters:
+                self.limiters[key] = ChannelLimiter(self.channel_burst, self.channel_interval)
+            return self.limiters[key]
+
+    def get_backoff(self, attempt):
+        return self.retry_backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+    def post(self, client, message):
+        # 반환값: (성공 여부, 소요 시간(초), 시도 횟수, 오류)
+        from slack_sdk.errors import SlackApiError
+
+        limiter = self.get_limiter(client, message['channel'])
+        start_time = time.perf_counter()
+        error = None
+        attempts = 0
+        while attempts <= self.max_retries:
+            attempts += 1
+            if attempts > 1:
+                METRICS.inc('retries', target='slack')
+            limiter.acquire()
+            try:
+                with METRICS.span('http', target='slack', method='chat.postMessage'):
+                    client.chat_postMessage(**message)
+                return True, time.perf_counter() - start_time, attempts, None
+            except SlackApiError as api_error:
+                error = api_error.response.get('error')
+                if error not in self.TEMPORARY_ERRORS:
+                    break
+                retry_after = api_error.response.headers.get('Retry-After')
+                if error == 'ratelimited' and retry_after:
+                    limiter.block(float(retry_after))
+                    continue
+            except OSError as os_error:  # 네트워크 오류, 타임아웃
+                error = str(os_error)
+            if attempts <= self.max_retries:
+                time.sleep(self.get_backoff(attempts - 1))
+        return False, time.perf_counter() - start_time, attempts, error
+
+    def post_all(self, jobs, on_result=None):
+        # jobs: 키 -> (클라이언트, 메시지), on_result(키, 결과): 전송 완료 즉시 호출 (결과 기록용)
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        if not jobs:
+            return {}
+        workers = max(1, min(self.max_workers, len(jobs)))
+        results = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self.post, client, message): key
+                       for key, (client, message) in jobs.items()}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+                if on_result:
+                    on_result(futures[future], results[futures[future]])
+
+        for key in jobs:
+            success, elapsed, attempts, error = results[key]
+            if success:
+                print(f"Slack post succeeded. : {key} ({elapsed:.2f}s, {attempts} attempt(s))")
+            else:
+                print(f"Slack API 오류 발생: {key} {error} ({elapsed:.2f}s, {attempts} attempt(s))")
+        return results
+
+
+class Broadcast(CommonFunc):
+    # 여러 채널/워크스페이스에 동일한 통계정보를 전송하고 대상별 결과를 RunLedger에 기록 (재실행 시 실패한 대상만 재전송)
+    def __init__(self, config, slack, ledger):
+        self.slack = slack
+        self.ledger = ledger
+        self.targets = self.load_targets(config)
+
+    def load_targets(self, config):
+        # [TARGET:이름] 섹션이 없으면 [SLACK] channel_id에 전체 언어 전송
+        targets = []
+        for section in config.sections():
+            if not section.startswith('TARGET:'):
+                continue
+            target = config[section]
+            targets.append({
+                'name': section.split(':', 1)[1],
+                'token': target.get('bot_token', self.slack.token),
+                'channel_id': target['channel_id'],
+                'languages': [lang.strip() for lang in target.get('languages', 'ko').split(',')],
+            })
+        if not targets:
+            targets.append({
+                'name': 'default',
+                'token': self.slack.token,
+                'channel_id': self.slack.channel_id,
+                'languages': ['ko', 'ja', 'en'],
+            })
+        return targets
+
+    def record(self, key, result):
+        success, elapsed, attempts, error = result
+        self.ledger.record_post(key, {'ok': success, 'elapsed': round(elapsed, 3),
+                                      'attempts': attempts, 'error': error})
+
+    def send(self, scheduler, texts, chart_files=None):
+        state = self.ledger.get_posts()
+        payloads = {}  # (토큰, 언어) -> 메시지 (언어별 1회 생성)
+        charts = {}    # 토큰 -> 업로드한 차트 파일 ID
+        jobs = {}
+        for target in self.targets:
+            for lang in target['languages']:
+                key = target['name'] + ':' + lang
+                if lang not in texts:
+                    print(f"Unknown language. : {key}")
+                    continue
+                if state.get(key, {}).get('ok'):
+                    print(f"Already posted. : {key}")
+                    continue
+                token = target['token']
+                if chart_files and token not in charts:
+                    charts[token] = self.slack.upload_charts(chart_files, token)
+                if (token, lang) not in payloads:
+                    payloads[(token, lang)] = self.slack.build_message(
+                        texts[lang], lang, charts.get(token))
+                message = dict(payloads[(token, lang)], channel=target['channel_id'])
+                jobs[key] = (self.slack.get_client(token), message)
+
+        # 전송 완료 즉시 기록하여 중단되더라도 전송한 대상은 재실행 시 건너뜀
+        scheduler.post_all(jobs, self.record)
+        keys = [target['name'] + ':' + lang for target in self.targets
+                for lang in target['languages'] if lang in texts]
+        state = self.ledger.get_posts()
+        return all(state.get(key, {}).get('ok') for key in keys)
+
+
+class RunLedger(CommonFunc):
+    # 기준일자별 실행 기록 (dir_result/YYYYMMDD_Ledger.json)
+    # - stages: 단계별 완료 시각, posts: 대상:언어별 전송 결과
+    # - owner: 실행 중인 프로세스 (lease_minutes 동안 유효, 다른 프로세스/호스트의 중복 실행 방지)
+    # - 잠금 파일(.lock)로 읽기-수정-쓰기를 직렬화하고, 임시 파일에 쓴 뒤 교체 (잠금 파일은 release 시 삭제)
+    # - 완료한 단계는 재실행 시 건너뜀 (backfill, extract, chart, alert)
+    def __init__(self, config, std_day=None):
+        self.std_day = std_day or date.today()
+        file_name = self.get_formatted_datetime(self.std_day, 1) + '_' + \
+            config.get('LEDGER', 'ledger_file', fallback='Ledger.json')
+        self.ledger_file = os.path.join(config.get('FILES', 'dir_result'), file_name)
+        self.lock_file = self.ledger_file + '.lock'
+        self.lease = timedelta(minutes=config.getfloat('LEDGER', 'lease_minutes', fallback=30))
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+
+    @contextlib.contextmanager
+    def locked(self, remove=False):
+        # remove: 잠금을 풀기 전에 잠금 파일 삭제 (대기 중이던 프로세스는 삭제된 파일임을 확인하고 다시 잠금)
+        os.makedirs(os.path.dirname(self.lock_file) or '.', exist_ok=True)
+        while True:
+            file = open(self.lock_file, 'a+b')
+            if os.name == 'nt':
+                import msvcrt
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+            try:
+                if os.path.isfile(self.lock_file) and \
+                        os.stat(self.lock_file).st_ino == os.fstat(file.fileno()).st_ino:
+                    break
+            except OSError:
+                pass
+            self.unlock(file)
+        try:
+            yield
+        finally:
+            if remove:
+                with contextlib.suppress(OSError):
+                    os.remove(self.lock_file)
+            self.unlock(file)
+
+    @staticmethod
+    def unlock(file):
+        if os.name == 'nt':
+            import msvcrt
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+        file.close()
+
+    def load(self):
+        if not os.path.isfile(self.ledger_file):
+            return {'std_day': self.std_day.isoformat(), 'stages': {}, 'posts': {}}
+        with open(self.ledger_file, encoding='utf-8') as file:
+            return json.load(file)
+
+    def save(self, ledger):
+        temp_file = f"{self.ledger_file}.{os.getpid()}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as file:
+            json.dump(ledger, file, ensure_ascii=False, indent=2)
+        os.replace(temp_file, self.ledger_file)
+
+    def update(self, func, remove_lock=False):
+        with self.locked(remove_lock):
+            ledger = self.load()
+            result = func(ledger)
+            self.save(ledger)
+        return result
+
+    def now(self):
+        return self.get_formatted_datetime(datetime.now(), 3)
+
+    def is_complete(self):
+        return 'complete' in self.load()['stages']
+
+    def claim(self):
+        # 반환값: 실행 권한 획득 여부 (완료되었거나 다른 프로세스가 실행 중이면 False)
+        def claim(ledger):
+            if 'complete' in ledger['stages']:
+                print(f"Already completed. : {self.ledger_file}")
+                return False
+            owner = ledger.get('owner')
+            if owner and owner['id'] != self.owner and \
+                    datetime.strptime(owner['expires'], '%Y-%m-%d %H:%M:%S') > datetime.now():
+                print(f"Another run in progress. : {owner['id']} (since {owner['since']})")
+                return False
+            ledger['owner'] = {'id': self.owner, 'since': self.now(),
+                               'expires': self.get_formatted_datetime(datetime.now() + self.lease, 3)}
+            return True
+        return self.update(claim)
+
+    def release(self):
+        def release(ledger):
+            if ledger.get('owner', {}).get('id') == self.owner:
+                del ledger['owner']
+        self.update(release, remove_lock=True)
+
+    def get_stage(self, stage):
+        return self.load()['stages'].get(stage)
+
+    def complete_stage(self, stage, **info):
+        def complete(ledger):
+            ledger['stages'][stage] = dict(info, done=self.now())
+            if ledger.get('owner', {}).get('id') == self.owner:
+                ledger['owner']['expires'] = self.get_formatted_datetime(datetime.now() + self.lease, 3)
+        self.update(complete)
+
+    def get_posts(self):
+        return self.load()['posts']
+
+    def record_post(self, key, result):
+        def record(ledger):
+            ledger['posts'][key] = dict(result, time=self.now())
+        self.update(record)
+
+
+class BulkBackfill(CommonFunc):
+    # 기간 전체(예: 2020-01-20 ~ 오늘)를 chunk_days 단위로 병렬 취득하여 저장소에 바로 반영
+    # 청크 완료 시마다 체크포인트를 저장하므로 중단 후 재실행하면 이어서 진행 (메모리는 청크 크기로 제한)
+    # 일시적인 오류로 실패한 날짜는 체크포인트에 기록하고 재실행 시 먼저 다시 요청
+    def __init__(self, config, covid19, store):
+        self.covid19 = covid19
+        self.store = store
+        self.chunk_days = config.getint('BACKFILL', 'chunk_days', fallback=30)
+        self.checkpoint_file = os.path.join(
+            config.get('FILES', 'dir_download'),
+            config.get('BACKFILL', 'checkpoint_file', fallback='Backfill.json'))
+
+    def load_checkpoint(self, start_date, end_date):
+        # 반환값: (이어서 진행할 날짜, 다시 요청할 실패 날짜 목록)
+        if not os.path.isfile(self.checkpoint_file):
+            return start_date, []
+        with open(self.checkpoint_file, encoding='utf-8') as file:
+            checkpoint = json.load(file)
+        if checkpoint.get('start') == start_date.isoformat() and \
+                checkpoint.get('end') == end_date.isoformat():
+            print(f"Resume backfill from checkpoint. : {checkpoint['next']}")
+            failed = [date.fromisoformat(day) for day in checkpoint.get('failed', [])]
+            return date.fromisoformat(checkpoint['next']), failed
+        return start_date, []
+
+    def save_checkpoint(self, start_date, end_date, next_date, failed=()):
+        os.makedirs(os.path.dirname(self.checkpoint_file) or '.', exist_ok=True)
+        temp_file = self.checkpoint_file + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as file:
+            json.dump({'start': start_date.isoformat(), 'end': end_date.isoformat(),
+                       'next': next_date.isoformat(), 'failed': [day.isoformat() for day in failed],
+                       'updated': self.get_formatted_datetime(datetime.now(), 3)}, file, indent=2)
+        os.replace(temp_file, self.checkpoint_file)
+
+    def fetch_day(self, dates):
+        # 반환값: 반영한 레코드 수 (데이터 없음 시 0, 일시적인 오류 등으로 실패 시 None)
+        if self.covid19.no_data.contains(dates):
+            return 0
+        response_body, no_data = self.covid19.fetch(dates, use_cache=False)
+        if not response_body:
+            if no_data:
+                self.covid19.no_data.add(dates)
+                return 0
+            return None
+        records = XmlRecordReader().iter_file(io.BytesIO(response_body))
+        return self.store.ingest_records(records)
+
+    def fetch_days(self, dates):
+        # 반환값: (반영한 레코드 수, 실패한 날짜 목록)
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=self.covid19.max_workers) as executor:
+            counts = list(executor.map(self.fetch_day, dates))
+        failed = [day for day, count in zip(dates, counts) if count is None]
+        return sum(count for count in counts if count), failed
+
+    def run_chunk(self, chunk_start, chunk_end):
+        # 반환값: 실패한 날짜 목록 (데이터 없음 제외)
+        stored = self.store.get_days(chunk_start, chunk_end)
+        dates = [chunk_start + timedelta(days=i) for i in range((chunk_end - chunk_start).days + 1)]
+        dates = [day for day in dates if day not in stored]
+        rows, failed = self.fetch_days(dates)
+        print(f"Backfill {chunk_start} ~ {chunk_end} : "
+              f"{len(dates)} requested, {len(stored)} stored before, {rows} rows ingested, "
+              f"{len(failed)} failed")
+        return failed
+
+    def retry_failed(self, failed):
+        # 반환값: 다시 요청한 뒤에도 실패한 날짜 목록 (그 사이 저장된 날짜는 제외)
+        failed = [day for day in failed if not self.store.get_days(day, day)]
+        if not failed:
+            return []
+        rows, failed = self.fetch_days(failed)
+        print(f"Backfill retry : {rows} rows ingested, {len(failed)} failed")
+        return failed
+
+    def is_circuit_open(self):
+        return self.covid19.http.breaker.state['state'] == 'open'
+
+    def run(self, start_date, end_date):
+        chunk_start, failed = self.load_checkpoint(start_date, end_date)
+        if failed:
+            with METRICS.span('stage', stage='bulk_backfill'):
+                failed = self.retry_failed(failed)
+            self.covid19.no_data.save()
+            self.save_checkpoint(start_date, end_date, chunk_start, failed)
+            if self.is_circuit_open():
+                print(f"Backfill stopped, API circuit open. : {len(failed)} failed days")
+                return False
+        while chunk_start <= end_date:
+            chunk_end = min(chunk_start + timedelta(days=self.chunk_days - 1), end_date)
+            with METRICS.span('stage', stage='bulk_backfill'):
+                chunk_failed = self.run_chunk(chunk_start, chunk_end)
+            self.covid19.no_data.save()
+            if self.is_circuit_open():
+                # 청크 일부가 누락되었을 수 있으므로 체크포인트를 진행하지 않고 중단
+                print(f"Backfill stopped, API circuit open. : {chunk_start} ~ {chunk_end}")
+                return False
+            failed += chunk_failed
+            chunk_start = chunk_end + timedelta(days=1)
+            self.save_checkpoint(start_date, end_date, chunk_start, failed)
+
+        if failed:
+            print(f"Backfill incomplete, retry failed days on next run. : "
+                  f"{', '.join(day.isoformat() for day in failed)}")
+            return False
+        print(f"Backfill completed. : {start_date} ~ {end_date}")
+        return True
+
+
+class Covid19Bot:
+    # 설정, API 클라이언트, 캐시를 보관하여 단발 실행과 데몬 모드에서 공통으로 사용
+    def __init__(self, sys_info, config):
+        self.sys_info = sys_info
+        self.config = config
+        METRICS.configure(config)
+        self.covid19 = Covid19API(sys_info, config)
+        self.file = FileAPI(sys_info, config, self.covid19)
+        self.slack = None
+        self.store = None
+        self.i18n = None
+
+    def is_posted(self):
+        return not FileAPI.check_result(self.file) or RunLedger(self.config).is_complete()
+
+    def check(self):
+        # 1. Check today's result data and C19 data
+        METRICS.reset()
+        with METRICS.span('stage', stage='check'):
+            found = not self.is_posted() and Covid19API.http_get(self.covid19, date.today())
+            self.covid19.no_data.save()
+            return found
+
+    def run(self):
+        # 같은 기준일자를 처리 중인 다른 실행(프로세스, 호스트)이 있으면 건너뜀
+        ledger = RunLedger(self.config)
+        if not ledger.claim():
+            return True
+        try:
+            return self.run_stages(ledger)
+        finally:
+            ledger.release()
+
+    def run_stages(self, ledger):
+        config = self.config
+        if self.slack is None:
+            self.slack = SlackAPI(self.sys_info, config)
+            self.store = CovidStore(config)
+            self.i18n = I18nAPI()
+        slack = self.slack
+
+        # 2~3. 이전 실행에서 추출까지 완료했으면 기록한 값을 사용 (다운로드, 추출, 시도별 지표 생략)
+        extracted = ledger.get_stage('extract')
+        if extracted:
+            print(f"Stage already completed, skipped. : backfill, extract ({extracted['done']})")
+            total_stdday_list, total_incdec_list = extracted['labels'], extracted['values']
+            data_cnt = extracted['counts']
+        else:
+            total_stdday_list, total_incdec_list, data_cnt = self.extract_stages(ledger)
+
+        # 4. Set the payload
+        with METRICS.span('stage', stage='payload'):
+            SlackAPI.set_payload(slack, total_stdday_list,
+                                total_incdec_list, data_cnt)
+            texts = {lang: I18nAPI.set_i18n(self.i18n, lang) for lang in self.i18n.i18n}
+
+        # Create chart (renderer = local: 차트를 1회 그려 언어별 문구로 저장, 워크스페이스별 1회 업로드)
+        chart_files = None
+        charted = ledger.get_stage('chart') if slack.renderer == 'local' and extracted else None
+        if charted and all(os.path.isfile(file_path) for file_path in charted['files'].values()):
+            print(f"Stage already completed, skipped. : chart ({charted['done']})")
+            chart_files = charted['files']
+        elif slack.renderer == 'local':
+            with METRICS.span('stage', stage='chart'):
+                chart_files = ChartAPI.create_charts(
+                    ChartAPI(config), total_stdday_list, total_incdec_list, texts)
+                ledger.complete_stage('chart', files=chart_files)
+
+        # 5. Post to Slack (대상/언어별 동시 전송, 전송한 대상은 재실행 시 건너뜀)
+        with METRICS.span('stage', stage='post'):
+            broadcast = Broadcast(config, slack, ledger)
+            success = Broadcast.send(broadcast, SlackScheduler(config), texts, chart_files)
+
+        # Alerts (새 stdDay만 반영하여 규칙 평가, 상태가 바뀐 경우만 전송)
+        if config.has_section('ALERT') and config.getboolean('ALERT', 'enabled', fallback=True) and \
+                not ledger.get_stage('alert'):
+            with METRICS.span('stage', stage='alert'):
+                self.send_alerts(ledger)
+
+        # 6. Save result (전체 전송 성공 시 기준일자 완료 기록)
+        with METRICS.span('stage', stage='save_result'):
+            if success:
+                ledger.complete_stage('complete')
+
+        # 7. Compact old xml files into monthly archives, apply retention
+        with METRICS.span('stage', stage='archive'):
+            self.file.archive.maintain()
+        return success
+
+    def extract_stages(self, ledger):
+        config = self.config
+
+        # 2. Check all C19 xml exist, Download C19 xml (이전 실행에서 받은 파일이 모두 있으면 생략)
+        downloaded = ledger.get_stage('backfill')
+        if downloaded and all(os.path.isfile(XmlArchive.split_member(file_path)[0] or file_path)
+                              for file_path in downloaded['files']):
+            print(f"Stage already completed, skipped. : backfill ({downloaded['done']})")
+            file_list = downloaded['files']
+            self.file.failed_dates = []
+        else:
+            with METRICS.span('stage', stage='backfill'):
+                file_list = FileAPI.set_date(self.file)
+                if self.file.failed_dates:
+                    # 받지 못한 날짜가 있으면 완료로 기록하지 않음 (재실행 시 없는 날짜만 다시 요청)
+                    print('Download failed, retry on next run. : ' +
+                          ', '.join(dates.isoformat() for dates in self.file.failed_dates))
+                else:
+                    ledger.complete_stage('backfill', files=file_list)
+
+        # 3. Extract C19 Data from xml file
+        with METRICS.span('stage', stage='extract'):
+            date_list = FileAPI.get_date_list(self.file) if self.file.carry_forward else None
+            total_stdday_list, total_incdec_list, data_cnt = ReadXmlData.get_data(
+                ReadXmlData(file_list, self.covid19.cache, self.store, date_list))
+
+        # Region analytics (config [REPORT] regions)
+        with METRICS.span('stage', stage='analytics'):
+            report = config['REPORT'] if config.has_section('REPORT') else {}
+            regions = [region.strip() for region in report.get('regions', 'Incheon').split(',')
+                       if region.strip()]
+            window_days = int(report.get('window_days', 28))
+            analytics = RegionAnalytics(self.store).load(
+                date.today() - timedelta(days=window_days - 1), date.today())
+            data_cnt['regions'] = analytics.get_summary(regions)
+            if not self.file.failed_dates:
+                ledger.complete_stage('extract', labels=total_stdday_list, values=total_incdec_list,
+                                      counts=data_cnt)
+        return total_stdday_list, total_incdec_list, data_cnt
+
+    def send_alerts(self, ledger):
+        config = self.config
+        engine = AlertEngine(config, self.store)
+        if not engine.rules:
+            return True
+        engine.update()
+        changes = engine.evaluate()
+        if not changes:
+            engine.commit(changes)
+            return True
+        lang = config.get('ALERT', 'lang', fallback='ko')
+        message = self.slack.build_alert(I18nAPI.set_i18n(self.i18n, lang), changes)
+        message['channel'] = config.get('ALERT', 'channel_id', fallback=self.slack.channel_id)
+        results = SlackScheduler(config).post_all({'alert': (self.slack.client, message)})
+        if results['alert'][0]:
+            engine.commit(changes)
+            ledger.complete_stage('alert', changes=len(changes))
+            METRICS.inc('alerts_sent', len(changes))
+        return results['alert'][0]
+
+
+class Daemon(CommonFunc):
+    # 프로세스를 유지하며 발표 예상 시간대에는 자주, 그 외에는 드물게 API를 확인
+    def __init__(self, bot, config):
+        self.bot = bot
+        weekdays = config.get('DAEMON', 'publish_weekdays', fallback='')
+        self.publish_weekdays = {int(day) for day in weekdays.split(',') if day.strip()}
+        self.publish_start = datetime.strptime(
+            config.get('DAEMON', 'publish_start', fallback='09:00'), '%H:%M').time()
+        self.publish_end = datetime.strptime(
+            config.get('DAEMON', 'publish_end', fallback='11:00'), '%H:%M').time()
+        self.fast_interval = config.getfloat('DAEMON', 'fast_interval', fallback=300)
+        self.slow_interval = config.getfloat('DAEMON', 'slow_interval', fallback=3600)
+        # 로컬 차트 폰트를 미리 불러 둠 (발표 시 바로 렌더링)
+        # 정기 전송은 차트 1개를 언어별 문구로 저장하므로 렌더링 워커 없이 현재 프로세스만 준비
+        if config.get('CHART', 'renderer', fallback='quickchart') == 'local':
+            ChartAPI(config).pool.warm(charts=1)
+
+    def is_publish_day(self, day):
+        return not self.publish_weekdays or day.weekday() in self.publish_weekdays
+
+    def in_publish_window(self, now):
+        return self.is_publish_day(now.date()) and \
+            self.publish_start <= now.time() <= self.publish_end
+
+    def next_window_start(self, now):
+        for days in range(8):
+            day = now.date() + timedelta(days=days)
+            start = datetime.combine(day, self.publish_start)
+            if start > now and self.is_publish_day(day):
+                return start
+        return now + timedelta(seconds=self.slow_interval)
+
+    def get_interval(self, now):
+        if self.in_publish_window(now):
+            return self.fast_interval
+        # 발표 시간대 밖에서는 slow_interval 간격, 단 다음 발표 시간대 시작은 놓치지 않음
+        until_window = (self.next_window_start(now) - now).total_seconds()
+        return max(1, min(self.slow_interval, until_window))
+
+    def poll(self):
+        bot = self.bot
+        METRICS.reset()
+        if bot.is_posted():
+            return True
+        # 데몬은 데이터 없음 캐시(TTL)를 거치지 않고 직접 확인
+        today = date.today()
+        response_body, no_data = Covid19API.fetch(bot.covid19, today)
+        if not response_body:
+            print(f"No data yet. : {self.get_formatted_datetime(today, 2)}")
+            return True
+        bot.covid19.no_data.discard(today)
+        bot.covid19.no_data.save()
+        print(f"New data found. : {self.get_formatted_datetime(today, 2)}")
+        return bot.run()
+
+    def run_forever(self):
+        print('Daemon started.')
+        while True:
+            success = True
+            try:
+                success = self.poll()
+            except Exception as error:  # 다음 폴링에서 다시 시도
+                success = False
+                print(f"Daemon poll failed: {error!r}")
+            METRICS.write(success)
+            interval = self.get_interval(datetime.now())
+            print(f"Next poll in {interval:.0f}s.")
+            time.sleep(interval)
+
+
+# 슬래시 명령 요청 (region: gubunEn, days: 기간(일), lang: 응답 언어)
+SlashQuery = namedtuple('SlashQuery', ['region', 'days', 'lang'])
+
+
+class SlashCommandService(CommonFunc):
+    # Socket Mode로 /covid 명령에 응답 (예: /covid 인천 30d, /covid total 7d)
+    # - 저장소(SQLite)에 없는 날짜만 API에서 취득하고, 이력과 응답 메시지는 LRU 캐시에서 바로 응답
+    # - 메시지는 정기 전송과 같은 I18nAPI 문구, SlackAPI 메시지 구성을 사용
+
+    def __init__(self, bot, config):
+        from concurrent.futures import ThreadPoolExecutor
+
+        slash = config['SLASH'] if config.has_section('SLASH') else {}
+        self.app_token = config.get('SLACK', 'app_token')
+        self.command = slash.get('command', '/covid')
+        self.default_days = int(slash.get('default_days', 7))
+        self.max_days = int(slash.get('max_days', 180))
+        self.default_lang = slash.get('default_lang', 'ko')
+        cache_size = int(slash.get('cache_size', 128))
+        self.history = LRUCache('slash_history', cache_size)
+        self.messages = LRUCache('slash_message', cache_size)
+
+        self.covid19 = bot.covid19
+        self.store = CovidStore(config)
+        self.backfill = BulkBackfill(config, bot.covid19, self.store)
+        self.i18n = I18nAPI()
+        self.slack = SlackAPI(bot.sys_info, config)  # 정기 전송과 payload를 공유하지 않도록 별도 생성
+        self.chart = ChartAPI(config) if self.slack.renderer == 'local' else None
+        self.lock = threading.Lock()  # SlackAPI payload 보호
+        self.executor = ThreadPoolExecutor(max_workers=int(slash.get('max_workers', 4)))
+        self.aliases = self.set_aliases()
+
+    def set_aliases(self):
+        # 시도명(언어별) -> (gubunEn, 언어)
+        aliases = {}
+        for lang, text in self.i18n.i18n.items():
+            for region, name in text['regions'].items():
+                aliases.setdefault(name.lower(), (region, lang))
+        for region in self.i18n.i18n['en']['regions']:
+            aliases.setdefault(region.lower(), (region, 'en'))
+        return aliases
+
+    def parse(self, command_text):
+        # [시도] [N]d [언어] 순서 무관, 생략 시 합계 / default_days / default_lang
+        region, days, lang = 'Total', self.default_days, None
+        for token in command_text.split():
+            lowered = token.lower()
+            if lowered in self.i18n.i18n:
+                lang = lowered
+            elif lowered.endswith('d') and lowered[:-1].isdigit():
+                days = int(lowered[:-1])
+            elif lowered in self.aliases:
+                region, alias_lang = self.aliases[lowered]
+                lang = lang or alias_lang
+            else:
+                raise ValueError(token)
+        if not 1 <= days <= self.max_days:
+            raise ValueError(f"{days}d")
+        return SlashQuery(region, days, lang or self.default_lang)
+
+    def get_range(self, query):
+        # 7일 평균, 전주대비 계산을 위해 요청 기간보다 13일 앞부터 확보
+        end_date = date.today()
+        return end_date - timedelta(days=query.days + 12), end_date
+
+    def is_covered(self, start_date, end_date):
+        stored = self.store.get_days(start_date, end_date)
+        day = start_date
+        while day <= end_date:
+            if day not in stored and not self.covid19.no_data.contains(day):
+                return False
+            day += timedelta(days=1)
+        return True
+
+    def get_cached(self, query):
+        # 반환값: LRU 캐시에 있는 응답 메시지, 없으면 None (저장소의 날짜만 확인하고 렌더링하지 않음)
+        start_date, end_date = self.get_range(query)
+        if not self.is_covered(start_date, end_date):
+            return None
+        latest = max(self.store.get_days(start_date, end_date), default=None)
+        return self.messages.get(query + (latest,)) if latest else None
+
+    def answer(self, query):
+        # 반환값: 응답 메시지 (저장소에 없는 날짜는 API에서 취득, 차트 렌더링/업로드 포함)
+        start_date, end_date = self.get_range(query)
+        if not self.is_covered(start_date, end_date):
+            with METRICS.span('stage', stage='slash_fetch'):
+                self.backfill.run_chunk(start_date, end_date)
+                self.covid19.no_data.save()
+        latest = max(self.store.get_days(start_date, end_date), default=None)
+        text = self.i18n.set_i18n(query.lang)
+        if latest is None:
+            return {'response_type': 'ephemeral', 'text': text.get('slash_no_data')}
+
+        key = query + (latest,)
+        message = self.messages.get(key)
+        if message is None:
+            with METRICS.span('stage', stage='slash_render'):
+                message = self.render(query, start_date, latest, text)
+            self.messages.put(key, message)
+        return message
+
+    def get_history(self, query, start_date, latest):
+        key = (query.region, start_date, latest)
+        records = self.history.get(key)
+        if records is None:
+            records = self.store.query(start_date, latest, [query.region])
+            self.history.put(key, records)
+        return records
+
+    def render(self, query, start_date, latest, text):
+        def number(value):
+            return '-' if value is None else format(value, ',')
+
+        records = self.get_history(query, start_date, latest)
+        shown = [record for record in records
+                 if record.std_day > latest - timedelta(days=query.days)]
+        if not shown:
+            return {'response_type': 'ephemeral', 'text': text.get('slash_no_data')}
+        last = shown[-1]
+        labels = [self.get_formatted_datetime(record.std_day, 2) for record in shown]
+        values = [str(record.inc_dec) for record in shown]
+        analytics = RegionAnalytics(self.store).load(start_date, latest)
+        counts = {
+            '전일대비확진자증감수': number(last.inc_dec),
+            '지역발생수': number(last.local_occ_cnt),
+            '해외유입수': number(last.over_flow_cnt),
+            '누적확진자수': number(last.def_cnt),
+            '사망자수': number(last.death_cnt),
+            'regions': analytics.get_summary([query.region]),
+        }
+
+        with self.lock:
+            SlackAPI.set_payload(self.slack, labels, values, counts)
+            self.slack.datetime = self.get_formatted_datetime(last.std_day, 2)
+            charts = None
+            if self.chart:
+                chart_files = self.chart.create_charts(labels, values, {query.lang: text})
+                charts = self.slack.upload_charts(chart_files)
+            message = self.slack.build_message(text, query.lang, charts)
+        message.pop('channel')
+        message['response_type'] = 'in_channel'
+        return message
+
+    def respond(self, response_url, query):
+        from slack_sdk.webhook import WebhookClient
+
+        try:
+            message = self.answer(query)
+        except Exception as error:  # 다음 요청에는 영향 없음
+            print(f"Slash command failed: {error!r}")
+            message = {'response_type': 'ephemeral',
+                       'text': self.i18n.set_i18n(query.lang).get('slash_error')}
+        WebhookClient(response_url).send_dict(message)
+
+    def handle(self, client, request):
+        from slack_sdk.socket_mode.response import SocketModeResponse
+
+        payload = request.payload
+        if request.type != 'slash_commands' or payload.get('command') != self.command:
+            client.send_socket_mode_response(SocketModeResponse(envelope_id=request.envelope_id))
+            return
+        start_time = time.perf_counter()
+        METRICS.inc('slash_commands')
+        try:
+            query = self.parse(payload.get('text', ''))
+        except ValueError:
+            usage = self.i18n.set_i18n(self.default_lang).get('slash_usage')
+            client.send_socket_mode_response(SocketModeResponse(
+                envelope_id=request.envelope_id,
+                payload={'response_type': 'ephemeral', 'text': usage}))
+            return
+
+        # LRU 캐시에 있는 응답만 ack와 함께 바로 전송 (3초 이내 ack)
+        # 없으면 ack 후 executor에서 API 취득, 차트 렌더링/업로드하여 response_url로 응답
+        try:
+            message = self.get_cached(query)
+        except Exception as error:  # ack는 항상 전송
+            print(f"Slash command cache lookup failed: {error!r}")
+            message = None
+        client.send_socket_mode_response(SocketModeResponse(
+            envelope_id=request.envelope_id, payload=message))
+        if message is None:
+            self.executor.submit(self.respond, payload['response_url'], query)
+        print(f"Slash command {payload.get('text', '')!r} : "
+              f"{'cached' if message else 'deferred'} ({time.perf_counter() - start_time:.3f}s)")
+
+    def run_forever(self):
+        from slack_sdk.socket_mode import SocketModeClient
+
+        client = SocketModeClient(app_token=self.app_token, web_client=self.slack.client)
+        client.socket_mode_request_listeners.append(self.handle)
+        client.connect()
+        print(f"Slash command service started. : {self.command}")
+        threading.Event().wait()
 
 
 # -------------------------------------------------------------------------------------------------#
@@ -562,39 +3072,78 @@ class SlackAPI(CommonFunc):
 # -------------------------------------------------------------------------------------------------#
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description='Covid19 Data Collection and Send a message to Slack')
+    parser.add_argument('--bench-startup', action='store_true',
+                        help='report import time and time to first decision, then exit')
+    parser.add_argument('--startup-budget', type=float, default=None, metavar='MS',
+                        help='exit with status 1 if the first decision takes longer than MS')
+    parser.add_argument('--daemon', action='store_true',
+                        help='keep running and poll the API on an adaptive schedule')
+    parser.add_argument('--serve', action='store_true',
+                        help='answer the /covid slash command over Socket Mode')
+    parser.add_argument('--backfill', nargs=2, metavar=('START', 'END'), type=date.fromisoformat,
+                        help='load history from START to END (YYYY-MM-DD) into the store and exit')
+    return parser.parse_args()
+
+
+def report_startup(decision, budget):
+    decision_time = time.perf_counter()
+    import_ms = (IMPORT_TIME - START_TIME) * 1000
+    decision_ms = (decision_time - START_TIME) * 1000
+    loaded = [name for name in HEAVY_MODULES if name in sys.modules]
+
+    print('Startup benchmark')
+    print(f"  import         : {import_ms:8.1f} ms")
+    print(f"  first decision : {decision_ms:8.1f} ms ({'post' if decision else 'skip'})")
+    print(f"  heavy modules  : {', '.join(loaded) if loaded else 'none'}")
+    if budget is not None and decision_ms > budget:
+        print(f"Startup budget exceeded. : {decision_ms:.1f} ms > {budget:.1f} ms")
+        return 1
+    return 0
+
+
 def main():
+    args = parse_args()
     sys_info = SystemInfo()
     config = ReadConfig.load_config(ReadConfig(sys_info))
-    covid19 = Covid19API(sys_info, config)
-    slack = SlackAPI(sys_info, config)
-    file = FileAPI(sys_info, config, covid19)
-
-    # 1. Check today's result data and C19 data
-    if FileAPI.check_result(file) and Covid19API.http_get(covid19, date.today()):
+    bot = Covid19Bot(sys_info, config)
 
-        # 2. Check all C19 xml exist, Download C19 xml
-        file_list = FileAPI.set_date(file)
+    if args.backfill:
+        METRICS.reset()
+        success = BulkBackfill.run(BulkBackfill(config, bot.covid19, CovidStore(config)), *args.backfill)
+        METRICS.write(success)
+        return 0 if success else 1
 
-        # 3. Extract C19 Data from xml file
-        total_stdday_list, total_incdec_list, data_cnt = ReadXmlData.get_data(
-            ReadXmlData(file_list))
-
-        # Create chart (matplotlib를 사용하여 차트를 새로 만드는 경우)
-        # ChartAPI.create_chart(ChartAPI(config), total_stdday_list, total_incdec_list
-
-        # 4. Set the payload
-        SlackAPI.set_payload(slack, total_stdday_list,
-                            total_incdec_list, data_cnt)
-
-        # 5. Set i18n and post to Slack
-        language = ['ko', 'ja', 'en']
-        for lang in language:
-            text = I18nAPI.set_i18n(I18nAPI(), lang)
-            SlackAPI.post_message(slack, text)
+    if args.serve:
+        try:
+            SlashCommandService.run_forever(SlashCommandService(bot, config))
+        except KeyboardInterrupt:
+            print('Slash command service stopped.')
+        return 0
 
-        # 6. Save result file
-        FileAPI.find_txt_file(file)
+    if args.daemon:
+        try:
+            Daemon.run_forever(Daemon(bot, config))
+        except KeyboardInterrupt:
+            print('Daemon stopped.')
+        return 0
+
+    decision = Covid19Bot.check(bot)
+    if args.bench_startup:
+        return report_startup(decision, args.startup_budget)
+
+    success = True
+    try:
+        if decision:
+            success = Covid19Bot.run(bot)
+    except Exception:
+        success = False
+        raise
+    finally:
+        METRICS.write(success)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())